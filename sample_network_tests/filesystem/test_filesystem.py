@@ -64,36 +64,60 @@ class FileSystemTests:
           tests_definitions (dict): Test parameters
         """
 
-        tops = tests_tools.TestOps(tests_definitions, TEST_SUITE, dut)
+        tops = tests_tools.TestOps(
+            tests_definitions, TEST_SUITE, dut, test_case="test_if_files_on_"
+        )
 
         files = tops.test_parameters["files"]
 
-        for file_name in files:
-            try:
-                """
-                TS: Run show command 'show file information' on dut
-                """
+        """
+        TS: Run show command 'show file information' on dut
+        """
 
-                show_cmd = f"show file information {file_name}"
-                self.output = tops.run_show_cmds([show_cmd])
-                assert self.output, "File information not collected."
-                logging.info(
-                    f"On device {tops.dut_name} output of {show_cmd} command is: {self.output}"
-                )
+        show_cmds = [f"show file information {file_name}" for file_name in files]
 
-                tops.actual_output = self.output[0]["result"]["isDir"]
-
-            except (
-                AssertionError,
-                AttributeError,
-                LookupError,
-                EapiError,
-            ) as exception:
-                logging.error(
-                    f"Error occurred during the testsuite execution on dut: {tops.dut_name}"
-                    f" is {str(exception)}"
+        try:
+            # one missing file fails the whole batch, so each file is then checked on its own
+            cmd_outputs = tops.run_show_cmds_per_cmd_on_error(show_cmds)
+            assert cmd_outputs, "File information not collected."
+            self.output, actual_outputs = [], []
+
+            for show_cmd, cmd_output in zip(show_cmds, cmd_outputs):
+                if isinstance(cmd_output, EapiError):
+                    logging.error(
+                        "Error occurred during the testsuite execution on dut: %s is %s",
+                        tops.dut_name,
+                        cmd_output,
+                    )
+                    self.output.append(str(cmd_output))
+                    actual_outputs.append(str(cmd_output))
+                    continue
+
+                self.output.append(cmd_output)
+
+                logging.info(
+                    "On device %s output of %s command is: %s",
+                    tops.dut_name,
+                    show_cmd,
+                    cmd_output,
                 )
-                tops.actual_output = str(exception)
+                actual_outputs.append(cmd_output["result"]["isDir"])
+
+        except (
+            AssertionError,
+            AttributeError,
+            LookupError,
+            EapiError,
+        ) as exception:
+            logging.error(
+                "Error occurred during the testsuite execution on dut: %s is %s",
+                tops.dut_name,
+                exception,
+            )
+            actual_outputs = [str(exception)] * len(files)
+
+        for file_name, actual_output in zip(files, actual_outputs):
+            tops.actual_output = actual_output
 
             if tops.actual_output == tops.expected_output:
                 tops.output_msg += (
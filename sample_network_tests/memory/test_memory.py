@@ -64,7 +64,9 @@ class MemoryTests:
             tests_definitions (dict): Test parameters
         """
 
-        tops = tests_tools.TestOps(tests_definitions, TEST_SUITE, dut)
+        tops = tests_tools.TestOps(
+            tests_definitions, TEST_SUITE, dut, test_case="test_memory_utilization_on_"
+        )
 
         try:
             """
@@ -73,17 +75,20 @@ class MemoryTests:
             self.output = dut["output"][tops.show_cmd]["json"]
             assert self.output, "Memory details are not collected."
             logging.info(
-                f"On device {tops.dut_name} output of {tops.show_cmd} command is: {self.output}"
+                "On device %s output of %s command is: %s",
+                tops.dut_name,
+                tops.show_cmd,
+                self.output,
             )
 
             memory_total = self.output["memTotal"]
-            memory_free = self.output["memFree"]
-            tops.actual_output = (float(memory_free) / float(memory_total)) * 100
+            tops.actual_output = (memory_total - self.output["memFree"]) * 100 / memory_total
 
         except (AssertionError, AttributeError, LookupError, EapiError) as exception:
             logging.error(
-                f"Error occurred during the testsuite execution on dut: "
-                f"{tops.dut_name} is {str(exception)}"
+                "Error occurred during the testsuite execution on dut: %s is %s",
+                tops.dut_name,
+                exception,
             )
             tops.actual_output = str(exception)
 
@@ -31,6 +31,7 @@
 
 """ Tests to validate ntp functionality."""
 
+import collections
 import pytest
 from pyeapi.eapilib import EapiError
 from vane import tests_tools
@@ -75,7 +76,9 @@ class NTPTests:
           dut (dict): Encapsulates dut details including name, connection
         """
 
-        tops = tests_tools.TestOps(tests_definitions, TEST_SUITE, dut)
+        tops = tests_tools.TestOps(
+            tests_definitions, TEST_SUITE, dut, test_case="test_if_ntp_is_synchronized_on_"
+        )
 
         try:
             """
@@ -84,7 +87,10 @@ class NTPTests:
             self.output = dut["output"][tops.show_cmd]["json"]
             assert self.output, "NTP server status details are not collected."
             logging.info(
-                f"On device {tops.dut_name} output of {tops.show_cmd} command is: {self.output}"
+                "On device %s output of %s command is: %s",
+                tops.dut_name,
+                tops.show_cmd,
+                self.output,
             )
 
             tops.actual_output = self.output["status"]
@@ -106,8 +112,9 @@ class NTPTests:
 
         except (AttributeError, LookupError, EapiError) as exception:
             logging.error(
-                f"On device {tops.dut_name}: Error while running testcase on DUT is: "
-                f"{str(exception)}"
+                "On device %s: Error while running testcase on DUT is: %s",
+                tops.dut_name,
+                exception,
             )
             tops.actual_output = str(exception)
             tops.output_msg += (
@@ -130,7 +137,9 @@ class NTPTests:
           dut (dict): Encapsulates dut details including name, connection
         """
 
-        tops = tests_tools.TestOps(tests_definitions, TEST_SUITE, dut)
+        tops = tests_tools.TestOps(
+            tests_definitions, TEST_SUITE, dut, test_case="test_if_ntp_associated_with_peers_on_"
+        )
 
         try:
             """
@@ -139,7 +148,10 @@ class NTPTests:
             self.output = dut["output"][tops.show_cmd]["json"]["peers"]
             assert self.output, "No NTP association details to collect."
             logging.info(
-                f"On device {tops.dut_name} output of {tops.show_cmd} command is: {self.output}"
+                "On device %s output of %s command is: %s",
+                tops.dut_name,
+                tops.show_cmd,
+                self.output,
             )
 
             tops.actual_output = len(self.output)
@@ -161,8 +173,9 @@ class NTPTests:
 
         except (AttributeError, LookupError, EapiError) as exception:
             logging.error(
-                f"On device {tops.dut_name}: Error while running testcase on DUT is: "
-                f"{str(exception)}"
+                "On device %s: Error while running testcase on DUT is: %s",
+                tops.dut_name,
+                exception,
             )
             tops.actual_output = str(exception)
             tops.output_msg += (
@@ -185,7 +198,9 @@ class NTPTests:
           dut (dict): Encapsulates dut details including name, connection
         """
 
-        tops = tests_tools.TestOps(tests_definitions, TEST_SUITE, dut)
+        tops = tests_tools.TestOps(
+            tests_definitions, TEST_SUITE, dut, test_case="test_if_process_is_running_on_"
+        )
 
         try:
             """
@@ -196,18 +211,23 @@ class NTPTests:
             self.output = dut["output"][tops.show_cmd]["json"]["processes"]
             assert self.output, "NTP processes details not collected."
             logging.info(
-                f"On device {tops.dut_name} output of {tops.show_cmd} command is: {self.output}"
+                "On device %s output of %s command is: %s",
+                tops.dut_name,
+                tops.show_cmd,
+                self.output,
             )
 
-            process_list = []
-
-            for process_num in self.output:
-                process_list.append(self.output[process_num]["cmd"])
+            # count every expected process in a single walk of the running commands
+            expected = set(processes)
+            process_counts = collections.Counter(
+                process
+                for running_process in self.output.values()
+                for process in expected
+                if process in running_process["cmd"]
+            )
 
             for process in processes:
-                results = [i for i in process_list if process in i]
-
-                tops.actual_output = len(results)
+                tops.actual_output = process_counts[process]
 
                 if tops.actual_output >= tops.expected_output:
                     tops.output_msg = (
@@ -233,8 +253,9 @@ class NTPTests:
 
         except (AttributeError, LookupError, EapiError) as exception:
             logging.error(
-                f"On device {tops.dut_name}: Error while running testcase on DUT is: "
-                f"{str(exception)}"
+                "On device %s: Error while running testcase on DUT is: %s",
+                tops.dut_name,
+                exception,
             )
             tops.actual_output = str(exception)
             tops.output_msg += (
@@ -258,7 +279,9 @@ class NTPTests:
           dut (dict): Encapsulates dut details including name, connection
         """
 
-        tops = tests_tools.TestOps(tests_definitions, TEST_SUITE, dut)
+        tops = tests_tools.TestOps(
+            tests_definitions, TEST_SUITE, dut, test_case="test_ntp_configuration_on_"
+        )
 
         try:
             """
@@ -268,7 +291,10 @@ class NTPTests:
             self.output = dut["output"][tops.show_cmd]["text"]
             assert self.output, "NTP configuration details not collected."
             logging.info(
-                f"On device {tops.dut_name} output of {tops.show_cmd} command is: {self.output}"
+                "On device %s output of %s command is: %s",
+                tops.dut_name,
+                tops.show_cmd,
+                self.output,
             )
 
             ntp_servers = tops.test_parameters["ntp_servers"]
@@ -328,8 +354,9 @@ class NTPTests:
 
         except (AttributeError, LookupError, EapiError) as exception:
             logging.error(
-                f"On device {tops.dut_name}: Error while running testcase on DUT is: "
-                f"{str(exception)}"
+                "On device %s: Error while running testcase on DUT is: %s",
+                tops.dut_name,
+                exception,
             )
             tops.actual_output = str(exception)
             tops.output_msg += (
@@ -352,28 +379,48 @@ class NTPTests:
           dut (dict): Encapsulates dut details including name, connection
         """
 
-        tops = tests_tools.TestOps(tests_definitions, TEST_SUITE, dut)
+        tops = tests_tools.TestOps(
+            tests_definitions, TEST_SUITE, dut, test_case="test_if_ntp_servers_are_reachable_on_"
+        )
 
         try:
             ntp_servers = tops.test_parameters["ntp_servers"]
             ntp_vrf = tops.test_parameters["ntp_vrf"]
 
-            for ntp_server in ntp_servers:
-                if ntp_vrf:
-                    show_cmd = f"ping vrf {ntp_vrf} ip {ntp_server}"
-                else:
-                    show_cmd = f"ping {ntp_server}"
+            if ntp_vrf:
+                show_cmds = [f"ping vrf {ntp_vrf} ip {ntp_server}" for ntp_server in ntp_servers]
+            else:
+                show_cmds = [f"ping {ntp_server}" for ntp_server in ntp_servers]
 
-                """
-                TS: Run ping command on dut
-                """
-                self.output = tops.run_show_cmds([show_cmd], encoding="text")
-                assert self.output, "Details from Ping command on dut not collected."
+            """
+            TS: Run ping command on dut
+            """
+            self.output = []
+            if show_cmds:
+                # one failed ping fails the whole batch, so each server is then pinged on its own
+                cmd_outputs = tops.run_show_cmds_per_cmd_on_error(show_cmds, encoding="text")
+                assert cmd_outputs, "Details from Ping command on dut not collected."
+
+                for show_cmd, cmd_output in zip(show_cmds, cmd_outputs):
+                    if isinstance(cmd_output, EapiError):
+                        logging.error(
+                            "On device %s: Error while running %s is: %s",
+                            tops.dut_name,
+                            show_cmd,
+                            cmd_output,
+                        )
+                        cmd_output = {"result": {"output": str(cmd_output)}}
+                    self.output.append(cmd_output)
+
+            for ntp_server, show_cmd, cmd_output in zip(ntp_servers, show_cmds, self.output):
                 logging.info(
-                    f"On device {tops.dut_name} output of {tops.show_cmd} command is: {self.output}"
+                    "On device %s output of %s command is: %s",
+                    tops.dut_name,
+                    show_cmd,
+                    cmd_output,
                 )
 
-                tops.actual_output = "bytes from" in self.output[0]["result"]["output"]
+                tops.actual_output = "bytes from" in cmd_output["result"]["output"]
                 if tops.actual_output == tops.expected_output:
                     result = True
                     tops.output_msg += (
@@ -399,8 +446,9 @@ class NTPTests:
 
         except (AttributeError, LookupError, EapiError) as exception:
             logging.error(
-                f"On device {tops.dut_name}: Error while running testcase on DUT is: "
-                f"{str(exception)}"
+                "On device %s: Error while running testcase on DUT is: %s",
+                tops.dut_name,
+                exception,
             )
             tops.actual_output = str(exception)
             tops.output_msg += (
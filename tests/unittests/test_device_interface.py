@@ -0,0 +1,207 @@
+"""Test class for device_interface.py"""
+
+import http.client
+import json
+import socket
+from unittest.mock import MagicMock
+import pytest
+import pyeapi.eapilib
+from vane.device_interface import PyeapiConn
+
+
+# pylint: disable=redefined-outer-name
+
+
+class FakeResponse:
+    """Successful eAPI response"""
+
+    status = 200
+    reason = "OK"
+
+    def __init__(self, error=None, will_close=False):
+        self._error = error
+        self.will_close = will_close
+
+    def read(self):
+        """Return the response body or fail while reading it"""
+        if self._error:
+            raise self._error
+        return json.dumps({"jsonrpc": "2.0", "id": 1, "result": [{}]})
+
+
+class FakeTransport:
+    """Stand-in for the http.client connection pyeapi uses as its transport
+
+    Like http.client, a request on a closed transport opens a new socket
+    and a response with Connection: close closes the transport. Each request
+    consumes one outcome: "ok", "close" for a Connection: close response, an
+    exception raised while sending the request, an exception raised waiting
+    for the response, or an exception raised while reading the response body.
+    """
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.sock = None
+        self.connects = 0
+        self.closes = 0
+        self.sent = []
+        self._outcome = None
+
+    def connect(self):
+        """Open a new socket"""
+        self.connects += 1
+        self.sock = MagicMock()
+
+    def close(self):
+        """Close the socket"""
+        self.closes += 1
+        self.sock = None
+
+    def putrequest(self, *_args, **_kwargs):
+        """Start a request, opening a socket if needed"""
+        if self.sock is None:
+            self.connect()
+        self._outcome = self.outcomes.pop(0)
+
+    def putheader(self, *_args):
+        """Add a request header"""
+
+    def endheaders(self, message_body=None):
+        """Send the request"""
+        if self._outcome[0] == "send":
+            raise self._outcome[1]
+        self.sent.append(message_body)
+
+    def getresponse(self):
+        """Wait for the response"""
+        if self._outcome[0] == "response":
+            raise self._outcome[1]
+        if self._outcome[0] == "read":
+            return FakeResponse(self._outcome[1])
+        if self._outcome[0] == "close":
+            self.close()
+            return FakeResponse(will_close=True)
+        return FakeResponse()
+
+
+def keep_alive_conn(outcomes):
+    """Return a pyeapi connection over a FakeTransport wrapped by _keep_alive"""
+    eapi_conn = pyeapi.eapilib.EapiConnection()
+    eapi_conn.transport = FakeTransport(outcomes)
+    PyeapiConn._keep_alive(eapi_conn)  # pylint: disable=protected-access
+
+    return eapi_conn
+
+
+def test_keep_alive_reuses_socket():
+    """Validates consecutive requests share one socket with TCP keepalive set"""
+    eapi_conn = keep_alive_conn([("ok",), ("ok",), ("ok",)])
+    transport = eapi_conn.transport
+
+    for _ in range(3):
+        eapi_conn.execute(["show version"])
+
+    assert transport.connects == 1
+    assert transport.closes == 0
+    assert len(transport.sent) == 3
+    transport.sock.setsockopt.assert_called_once_with(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+
+def test_keep_alive_closes_when_device_closes():
+    """Validates a Connection: close response closes the socket before the next request"""
+    eapi_conn = keep_alive_conn([("close",), ("close",), ("ok",), ("ok",)])
+    transport = eapi_conn.transport
+
+    for _ in range(4):
+        eapi_conn.execute(["show version"])
+
+    assert transport.connects == 3
+    assert transport.closes == 2
+    assert len(transport.sent) == 4
+    assert not transport.outcomes
+
+
+@pytest.mark.parametrize(
+    "outcome",
+    [
+        ("response", http.client.RemoteDisconnected("Remote end closed connection")),
+        ("response", ConnectionResetError(104, "Connection reset by peer")),
+        ("send", BrokenPipeError(32, "Broken pipe")),
+    ],
+)
+def test_keep_alive_reconnects_after_peer_drop(outcome):
+    """Validates a request on a socket the device dropped is sent again on a new socket"""
+    eapi_conn = keep_alive_conn([("ok",), outcome, ("ok",)])
+    transport = eapi_conn.transport
+
+    eapi_conn.execute(["show version"])
+    eapi_conn.execute(["show clock"])
+
+    assert transport.connects == 2
+    assert transport.closes == 1
+    assert not transport.outcomes
+    assert json.loads(transport.sent[-1])["params"]["cmds"] == ["show clock"]
+
+
+@pytest.mark.parametrize(
+    "outcome",
+    [
+        ("response", socket.timeout("timed out")),
+        ("response", http.client.RemoteDisconnected("Remote end closed connection")),
+        ("read", ConnectionResetError(104, "Connection reset by peer")),
+    ],
+)
+def test_keep_alive_no_retry_after_request_sent(outcome):
+    """Validates a request the device may have run is never sent twice"""
+    eapi_conn = keep_alive_conn([("ok",), outcome, ("ok",)])
+    transport = eapi_conn.transport
+
+    eapi_conn.execute(["show version"])
+    with pytest.raises(pyeapi.eapilib.ConnectionError):
+        eapi_conn.execute(["configure", "no interface Ethernet1"])
+
+    configure_requests = [
+        body for body in transport.sent if "configure" in json.loads(body)["params"]["cmds"]
+    ]
+    assert len(configure_requests) == 1
+    assert transport.outcomes == [("ok",)]
+
+
+def test_keep_alive_retries_config_not_sent():
+    """Validates a request that failed while sending is sent again, whatever its commands"""
+    eapi_conn = keep_alive_conn([("ok",), ("send", BrokenPipeError(32, "Broken pipe")), ("ok",)])
+    transport = eapi_conn.transport
+
+    eapi_conn.execute(["show version"])
+    eapi_conn.execute(["configure", "no interface Ethernet1"])
+
+    assert not transport.outcomes
+    assert len(transport.sent) == 2
+
+
+def test_keep_alive_no_retry_on_new_socket():
+    """Validates a request failing on a freshly opened socket is not retried"""
+    eapi_conn = keep_alive_conn(
+        [("response", http.client.RemoteDisconnected("Remote end closed connection")), ("ok",)]
+    )
+
+    with pytest.raises(pyeapi.eapilib.ConnectionError):
+        eapi_conn.execute(["show version"])
+
+    assert eapi_conn.transport.outcomes == [("ok",)]
+
+
+def test_keep_alive_closes_on_error():
+    """Validates the socket is closed after a failed request and the close is restored"""
+    eapi_conn = keep_alive_conn([("response", socket.timeout("timed out")), ("ok",)])
+    transport = eapi_conn.transport
+
+    with pytest.raises(pyeapi.eapilib.ConnectionError):
+        eapi_conn.execute(["show version"])
+
+    assert transport.closes == 1
+    assert transport.sock is None
+    assert "close" not in transport.__dict__
+
+    eapi_conn.execute(["show version"])
+    assert transport.connects == 2
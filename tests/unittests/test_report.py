@@ -7,7 +7,7 @@ report_client.py unit tests
 
 import datetime
 
-from vane import report_client
+from vane import report_client, tests_tools
 
 
 DEFINITIONS = "tests/unittests/fixtures/report_definitions.yaml"
@@ -84,3 +84,48 @@ def test_if_keys_in_dict(duts_dict):
         total = RC._totals(duts, question)
 
         assert total == answer
+
+
+def test_compile_json_results(tmp_path):
+    """Verify a JSON results file written by a test case is read into the results data model"""
+
+    report = report_client.ReportClient(DEFINITIONS)
+    report._results_datamodel = None
+    test_parameters = {
+        "name": "test_if_intf_protocol_status_is_connected_on_",
+        "test_suite": "sample_network_tests/interfaces/test_interfaces.py",
+        "dut": "DSR01",
+        "test_result": True,
+        "fail_or_skip_reason": "",
+        "actual_output": {1: "connected", 2: "connected"},
+        "expected_output": ("connected", "connected"),
+        "date_generated": datetime.datetime(2023, 5, 1, 12, 30),
+    }
+    tests_tools.export_json(
+        str(tmp_path / "result-test_if_intf_protocol_status_is_connected_on_-DSR01.json"),
+        test_parameters,
+    )
+
+    report._compile_yaml_data(str(tmp_path))
+
+    # dates come back as strings, tuples as lists and integer keys as strings
+    assert report._results_datamodel == {
+        "test_suites": [
+            {
+                "name": "test_interfaces.py",
+                "test_cases": [
+                    {
+                        "name": "test_if_intf_protocol_status_is_connected_on_",
+                        "duts": [
+                            {
+                                **test_parameters,
+                                "actual_output": {"1": "connected", "2": "connected"},
+                                "expected_output": ["connected", "connected"],
+                                "date_generated": "2023-05-01 12:30:00",
+                            }
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
@@ -2,6 +2,7 @@
 
 from unittest.mock import call
 import os
+import re
 import pytest
 from vane import test_step_client
 
@@ -89,26 +90,49 @@ def test_walk_dir(logdebug, mocker):
     test_steps.walk_dir()
     mocker_object.assert_called_once()
 
-    # These files are unique to git actions ci environment
-    # This test will fail if ran locally
-    files1 = ["__init__.cpython-39.pyc", "test_host.cpython-39-pytest-7.4.0.pyc"]
-    files2 = [
-        "test_definition.yaml",
-        "test_host.py",
-        "test_definition_regenerated.yaml",
-        "__init__.py",
-    ]
-
     logdebug_calls = [
         call(f"Set Test Step Client object directory to {[TEST_DIR]}"),
         call(f"Walking directory {TEST_DIR} for test cases"),
-        call(f"Discovered files {files1} in directory {TEST_DIR}"),
-        call(f"Discovered files {files2} in directory {TEST_DIR}"),
-        call(f"Discovered test files: {TEST_FILE} for parsing"),
+        call("Scanning directory %s for test files", TEST_DIR),
+        # __pycache__ is only present in the git actions ci environment
+        call("Scanning directory %s for test files", f"{TEST_DIR}/__pycache__"),
+        call("Discovered test files: %s for parsing", TEST_FILE),
     ]
     logdebug.assert_has_calls(logdebug_calls, any_order=False)
 
 
+def test_walk_dir_test_files(mocker):
+    "Unit Test for TestStepClient object, walk_dir finds the same test files as os.walk"
+
+    mocker_object = mocker.patch("vane.test_step_client.TestStepClient.parse_file")
+    test_steps = test_step_client.TestStepClient(["sample_network_tests"])
+    test_steps.walk_dir()
+
+    expected_files = sorted(
+        os.path.join(root, name)
+        for root, _dirs, files in os.walk("sample_network_tests", topdown=False)
+        for name in files
+        if name.startswith("test_") and name.endswith(".py") or name.endswith("_test.py")
+    )
+    mocker_object.assert_called_once_with(expected_files)
+
+
+def test_walk_dir_overlapping_dirs(mocker):
+    "Unit Test for TestStepClient object, walk_dir parses files under overlapping dirs once"
+
+    mocker_object = mocker.patch("vane.test_step_client.TestStepClient.parse_file")
+    test_steps = test_step_client.TestStepClient(
+        ["tests/unittests/fixtures", TEST_DIR, "tests/unittests/fixtures/../fixtures/host"]
+    )
+    test_steps.walk_dir()
+
+    test_files = mocker_object.call_args[0][0]
+    mocker_object.assert_called_once()
+    assert test_files == sorted(test_files)
+    assert len({os.path.realpath(test_file) for test_file in test_files}) == len(test_files)
+    assert TEST_FILE[0] in test_files
+
+
 def test_parse_file(loginfo, logdebug, mocker):
     "Unit Test for TestStepClient object module parse_file"
 
@@ -117,12 +141,10 @@ def test_parse_file(loginfo, logdebug, mocker):
         "vane.test_step_client.TestStepClient.now",
         return_value="01/01/2023 00:00:00",
     )
-    mocker_object_one = mocker.patch("vane.test_step_client.TestStepClient.output_json")
-    mocker_object_two = mocker.patch("vane.test_step_client.TestStepClient.output_md")
+    mocker_object = mocker.patch("vane.test_step_client.TestStepClient.output_steps")
     test_steps = test_step_client.TestStepClient([TEST_DIR])
     test_steps.parse_file(TEST_FILE)
-    mocker_object_one.assert_called_once()
-    mocker_object_two.assert_called_once()
+    mocker_object.assert_called_once_with(TEST_FILE[0], TEST_STEP)
 
     loginfo_calls = [
         call("Parsing files for test steps and definitions"),
@@ -130,7 +152,7 @@ def test_parse_file(loginfo, logdebug, mocker):
     loginfo.assert_has_calls(loginfo_calls, any_order=False)
 
     logdebug_calls = [
-        call(f"Create JSON and MD files for {TEST_FILE[0]} using {TEST_STEP}"),
+        call("Create JSON and MD files for %s using %s", TEST_FILE[0], TEST_STEP),
     ]
     logdebug.assert_has_calls(logdebug_calls, any_order=False)
 
@@ -143,13 +165,13 @@ def test_parse_file_no_steps(loginfo, logdebug, mocker):
         "vane.test_step_client.TestStepClient.now",
         return_value="01/01/2023 00:00:00",
     )
-    mocker_object_one = mocker.patch("vane.test_step_client.TestStepClient.output_json")
-    mocker_object_two = mocker.patch("vane.test_step_client.TestStepClient.output_md")
+    mocker_object = mocker.patch("vane.test_step_client.TestStepClient.output_steps")
 
     test_steps = test_step_client.TestStepClient([TEST_DIR])
     test_steps.parse_file(["tests/unittests/fixtures/host/test_definition.yaml"])
-    mocker_object_one.assert_called_once()
-    mocker_object_two.assert_called_once()
+    mocker_object.assert_called_once_with(
+        "tests/unittests/fixtures/host/test_definition.yaml", NO_TEST_STEPS
+    )
 
     loginfo_calls = [
         call("Parsing files for test steps and definitions"),
@@ -158,13 +180,70 @@ def test_parse_file_no_steps(loginfo, logdebug, mocker):
 
     logdebug_calls = [
         call(
-            "Create JSON and MD files for tests/unittests/fixtures/host/test_definition.yaml"
-            f" using {NO_TEST_STEPS}"
+            "Create JSON and MD files for %s using %s",
+            "tests/unittests/fixtures/host/test_definition.yaml",
+            NO_TEST_STEPS,
         ),
     ]
     logdebug.assert_has_calls(logdebug_calls, any_order=False)
 
 
+@pytest.mark.parametrize(
+    "content, expected_output",
+    [
+        (
+            '"""TD: Verify hostname\n\n    Args:\n    """\n    """\n    TS: Run show hostname\n    """',
+            ["TD: Verify hostname\n\n    ", "TS: Run show hostname\n    "],
+        ),
+        ('"""TS: no closing marker', []),
+        ('TS: TD: first """ TS: second Args: TD: third', ["TS: TD: first ", "TS: second "]),
+        ("no test steps here", []),
+    ],
+)
+def test_find_test_steps(content, expected_output):
+    "Unit Test for find_test_steps, matches the TS/TD regular expression it replaced"
+
+    assert test_step_client.find_test_steps(content) == expected_output
+    assert re.findall('(T[SD]:.*?)(?:"""|Args:)', content, re.DOTALL) == expected_output
+
+
+def test_parse_file_output_order(mocker):
+    "Unit Test for TestStepClient object module parse_file writes outputs in test file order"
+
+    mocker.patch(
+        "vane.test_step_client.TestStepClient.now",
+        return_value="01/01/2023 00:00:00",
+    )
+    mocker_object = mocker.patch("vane.test_step_client.TestStepClient.output_steps")
+    test_files = [
+        TEST_FILE[0],
+        "tests/unittests/fixtures/host/test_definition.yaml",
+        TEST_FILE[0],
+    ]
+
+    test_steps = test_step_client.TestStepClient([TEST_DIR])
+    test_steps.parse_file(test_files)
+
+    assert mocker_object.call_args_list == [
+        call(TEST_FILE[0], TEST_STEP),
+        call("tests/unittests/fixtures/host/test_definition.yaml", NO_TEST_STEPS),
+        call(TEST_FILE[0], TEST_STEP),
+    ]
+
+
+def test_parse_file_missing_file(mocker):
+    "Unit Test for TestStepClient object module parse_file with an unreadable file"
+
+    logerror = mocker.patch("vane.vane_logging.logging.error")
+    mocker_object = mocker.patch("vane.test_step_client.TestStepClient.output_steps")
+
+    test_steps = test_step_client.TestStepClient([TEST_DIR])
+    test_steps.parse_file(["tests/unittests/fixtures/host/test_missing.py"])
+
+    mocker_object.assert_not_called()
+    logerror.assert_called_once()
+
+
 def test_output_json():
     "Unit Test for TestStepClient object module output_json"
 
@@ -182,6 +261,26 @@ def test_output_json():
     assert expected_output == actual_output
 
 
+def test_output_steps(mocker):
+    "Unit Test for TestStepClient object module output_steps"
+
+    mocker_object = mocker.patch("vane.test_step_client.TestStepClient._write_md")
+
+    with open("tests/unittests/fixtures/expected_test_host.json", encoding="utf_8") as f_name:
+        expected_output = f_name.read()
+
+    test_steps = test_step_client.TestStepClient([TEST_DIR])
+    test_steps.output_steps(TEST_FILE[0], TEST_STEP)
+
+    with open("tests/unittests/fixtures/host/test_host.json", encoding="utf_8") as j_file:
+        actual_output = j_file.read()
+
+    file_clean_up("tests/unittests/fixtures/host/test_host.json")
+
+    assert expected_output == actual_output
+    mocker_object.assert_called_once_with("tests/unittests/fixtures/host/test_host", TEST_STEP)
+
+
 def test_output_md():
     "Unit Test for TestStepClient object module output_md"
 
@@ -218,6 +317,53 @@ def test_output_md_no_steps():
     assert expected_output == actual_output
 
 
+def test_output_md_repeated_last_step():
+    "Unit Test for TestStepClient object module output_md when the last step also appears earlier"
+
+    steps = [
+        "01/01/2023 00:00:00",
+        "TD: Verify hostname is set on device is correct",
+        "TS: Creating test report based on results",
+        "TS: Verify LLDP system name",
+        "TS: Creating test report based on results",
+    ]
+
+    test_steps = test_step_client.TestStepClient([TEST_DIR])
+    test_steps.output_md({TEST_FILE[0]: steps})
+
+    with open("tests/unittests/fixtures/host/test_host.md", encoding="utf_8") as f_name:
+        actual_output = f_name.read()
+
+    file_clean_up("tests/unittests/fixtures/host/test_host.md")
+
+    assert actual_output.endswith(
+        "\n1.  Creating test report based on results"
+        "\n2.  Verify LLDP system name"
+        "\n3.  Creating test report based on results\n"
+    )
+
+
+def test_output_md_marker_prefix_only():
+    "Unit Test for TestStepClient object module output_md strips only the TD:/TS: marker"
+
+    steps = [
+        "01/01/2023 00:00:00",
+        "TD:Diagnostics are collected",
+        "TS:Show tech-support is collected",
+    ]
+
+    test_steps = test_step_client.TestStepClient([TEST_DIR])
+    test_steps.output_md({TEST_FILE[0]: steps})
+
+    with open("tests/unittests/fixtures/host/test_host.md", encoding="utf_8") as f_name:
+        actual_output = f_name.read()
+
+    file_clean_up("tests/unittests/fixtures/host/test_host.md")
+
+    assert "\n# Diagnostics are collected\n" in actual_output
+    assert "\n1. Show tech-support is collected\n" in actual_output
+
+
 def test_output_md_multiple_tests():
     "Unit Test for TestStepClient object module output_md"
 
@@ -174,12 +174,14 @@ def test_parametrize_duts(loginfo, logdebug):
 
     logdebug_calls = [
         call(
-            "Creating dut parameters.  \nDuts: [{'role': 'Role1', 'name': 'DLFW3'}, "
-            "{'role': 'Role2', 'name': 'Test Dut 2'}] \nIds: ['DLFW3', 'Test Dut 2']"
+            "Creating dut parameters.  \nDuts: %s \nIds: %s",
+            [{"role": "Role1", "name": "DLFW3"}, {"role": "Role2", "name": "Test Dut 2"}],
+            ["DLFW3", "Test Dut 2"],
         ),
         call(
-            "Creating dut parameters.  \nDuts: [{'role': 'Role1', 'name': 'DLFW3'}]"
-            " \nIds: ['DLFW3']"
+            "Creating dut parameters.  \nDuts: %s \nIds: %s",
+            [{"role": "Role1", "name": "DLFW3"}],
+            ["DLFW3"],
         ),
     ]
     logdebug.assert_has_calls(logdebug_calls, any_order=False)
@@ -234,6 +236,42 @@ def test_import_yaml_success(mocker):
     assert expected_yaml == actual_yaml
 
 
+def test_yaml_read_cached(tmp_path):
+    """Validates yaml read method returns cached copies until the file changes"""
+    yaml_file = tmp_path / "test_definition.yaml"
+    yaml_file.write_text("a: 1\nb: [1, 2]\n", encoding="utf-8")
+
+    first_yaml = tests_tools.yaml_read(str(yaml_file))
+    first_yaml["b"].append(3)
+    second_yaml = tests_tools.yaml_read(str(yaml_file))
+    assert second_yaml == {"a": 1, "b": [1, 2]}
+
+    yaml_file.write_text("a: 1\nb: [1, 2, 3, 4]\n", encoding="utf-8")
+    third_yaml = tests_tools.yaml_read(str(yaml_file))
+    assert third_yaml == {"a": 1, "b": [1, 2, 3, 4]}
+
+
+def test_yaml_read_same_size_edit(tmp_path):
+    """Validates yaml read method re-reads a file edited or replaced without a size change"""
+    yaml_file = tmp_path / "test_definition.yaml"
+    yaml_file.write_text("a: 1\n", encoding="utf-8")
+    assert tests_tools.yaml_read(str(yaml_file)) == {"a": 1}
+
+    # edited in place, same size
+    file_stat = yaml_file.stat()
+    yaml_file.write_text("a: 2\n", encoding="utf-8")
+    os.utime(yaml_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+    assert tests_tools.yaml_read(str(yaml_file)) == {"a": 2}
+
+    # replaced by a new file with the same size and modification time
+    file_stat = yaml_file.stat()
+    new_file = tmp_path / "test_definition.yaml.new"
+    new_file.write_text("a: 3\n", encoding="utf-8")
+    os.utime(new_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+    os.replace(new_file, yaml_file)
+    assert tests_tools.yaml_read(str(yaml_file)) == {"a": 3}
+
+
 def test_import_yaml_non_existing_file(mocker, logerr):
     """Validates import yaml method with non-existing file"""
     sys_exit_mocked = mocker.patch("sys.exit")
@@ -266,10 +304,10 @@ def test_init_duts(loginfo, logdebug, mocker):
     loginfo.assert_has_calls(loginfo_calls, any_order=False)
 
     logdebug_calls = [
-        call("Duts login info: DUTS and create 4 workers"),
-        call("Passing the following show commands to workers: ['show version', 'show clock']"),
+        call("Duts login info: %s and create %s workers", "DUTS", 4),
+        call("Passing the following show commands to workers: %s", ["show version", "show clock"]),
         call("Future object generated successfully"),
-        call("Return duts data structure: DUTS"),
+        call("Return duts data structure: %s", "DUTS"),
     ]
     logdebug.assert_has_calls(logdebug_calls, any_order=False)
 
@@ -365,9 +403,9 @@ def test_send_cmds_json(loginfo, logdebug, mocker):
     assert show_cmd_list_output == show_cmds
     loginfo.assert_called_with("Ran all show commands on dut")
     logdebug_calls = [
-        call("List of show commands in show_cmds with encoding json: ['show version']"),
-        call("Ran all show cmds with encoding json: ['show version']"),
-        call("Return all show cmds: output_in_json"),
+        call("List of show commands in show_cmds with encoding %s: %s", "json", ["show version"]),
+        call("Ran all show cmds with encoding %s: %s", "json", ["show version"]),
+        call("Return all show cmds: %s", "output_in_json"),
     ]
     logdebug.assert_has_calls(logdebug_calls, any_order=False)
 
@@ -390,9 +428,9 @@ def test_send_cmds_text(loginfo, logdebug, mocker):
     assert show_cmd_list_output == show_cmds
     loginfo.assert_called_with("Ran all show commands on dut")
     logdebug_calls = [
-        call("List of show commands in show_cmds with encoding text: ['show version']"),
-        call("Ran all show cmds with encoding text: ['show version']"),
-        call("Return all show cmds: output_in_text"),
+        call("List of show commands in show_cmds with encoding %s: %s", "text", ["show version"]),
+        call("Ran all show cmds with encoding %s: %s", "text", ["show version"]),
+        call("Return all show cmds: %s", "output_in_text"),
     ]
     logdebug.assert_has_calls(logdebug_calls, any_order=False)
 
@@ -405,7 +443,6 @@ def test_send_cmds_exception(logdebug, logerror, mocker):
     mocker_object = mocker.patch("vane.device_interface.PyeapiConn.run_commands")
     mocker_object.side_effect = [
         Exception("show version is erring"),
-        "",
     ]
 
     show_cmds = ["show version"]
@@ -414,16 +451,35 @@ def test_send_cmds_exception(logdebug, logerror, mocker):
     )
 
     # asserting when run_commands raises an exception
-    assert show_cmds_output == ""
+    assert show_cmds_output == []
     assert show_cmd_list_output == []
+    assert mocker_object.call_count == 1
     logdebug_calls = [
-        call("New show_cmds: []"),
+        call("New show_cmds: %s", []),
     ]
     logdebug.assert_has_calls(logdebug_calls, any_order=False)
 
     logerror.assert_called_with("Error running all cmds: show version is erring")
 
 
+def test_send_cmds_unrelated_exception(logerror, mocker):
+    """Validates send_cmds gives up when the error does not name a show command"""
+
+    mocker_object = mocker.patch("vane.device_interface.PyeapiConn.run_commands")
+    mocker_object.side_effect = Exception("Socket error during eAPI connection")
+
+    show_cmds_output, show_cmd_list_output = tests_tools.send_cmds(
+        ["show version", "show clock"], vane.device_interface.PyeapiConn, "json"
+    )
+
+    assert show_cmds_output == []
+    assert show_cmd_list_output == []
+    assert mocker_object.call_count == 1
+    logerror.assert_called_with(
+        "Unable to run show cmds with encoding %s: %s", "json", ["show version", "show clock"]
+    )
+
+
 error = ["show lldp neighbors has an error in it", "show lldp neighbors status has an error in it"]
 show_cmds = [
     ["show version", "show clock", "show lldp neighbors", "show lldp neighbors status"],
@@ -442,8 +498,26 @@ expected_output = [
 def test_remove_cmd(error, show_cmds, expected_output):
     """Validates functionality of remove_cmd method"""
 
+    original_show_cmds = list(show_cmds)
     actual_output = tests_tools.remove_cmd(error, show_cmds)
     assert expected_output == actual_output
+    assert show_cmds == original_show_cmds
+
+
+def test_send_cmd_batches(mocker):
+    """Validates show commands are sent to the dut in batches"""
+    show_cmds = [f"show interfaces ethernet{index}" for index in range(45)]
+    mocker_object = mocker.patch(
+        "vane.tests_tools.send_cmds", side_effect=lambda cmds, conn, encoding: (cmds, cmds)
+    )
+
+    show_cmd_list, sent_cmds = tests_tools.send_cmd_batches(show_cmds, "conn", "json")
+
+    assert show_cmd_list == show_cmds
+    assert sent_cmds == show_cmds
+    mocker_object.assert_has_calls(
+        [call(show_cmds[:40], "conn", "json"), call(show_cmds[40:], "conn", "json")]
+    )
 
 
 def test_dut_worker(logdebug, mocker):
@@ -488,21 +562,21 @@ def test_dut_worker(logdebug, mocker):
     assert dut["output"]["show clock"]["text"] == "clock_output_text"
 
     logdebug_calls = [
-        call("List of show commands ['show version', 'show clock']"),
-        call("Returned from send_cmds_json ['show version']"),
-        call("Returned from send_cmds_txt ['show clock']"),
+        call("List of show commands %s", ["show version", "show clock"]),
+        call("Returned from send_cmds_json %s", ["show version"]),
+        call("Returned from send_cmds_txt %s", ["show clock"]),
         call("Executing show command: show version for test test_show_version"),
         call("Adding output of show version to duts data structure"),
-        call("Found cmd: show version at index 0 of ['show version']"),
+        call("Found cmd: %s at index %s of %s", "show version", 0, ["show version"]),
         call("length of cmds: 1 vs length of output 1"),
-        call("Adding cmd show version to dut and data version_output_json"),
+        call("Adding cmd %s to dut and data %s", "show version", "version_output_json"),
         call("No text output for show version"),
         call("Executing show command: show clock for test test_show_clock"),
         call("Adding output of show clock to duts data structure"),
         call("No json output for show clock"),
-        call("Found cmd: show clock at index 0 of ['show clock']"),
+        call("Found cmd: %s at index %s of %s", "show clock", 0, ["show clock"]),
         call("length of cmds: 1 vs length of output 1"),
-        call("Adding cmd show clock to dut and data clock_output_text"),
+        call("Adding cmd %s to dut and data %s", "show clock", "clock_output_text"),
     ]
     logdebug.assert_has_calls(logdebug_calls, any_order=False)
 
@@ -549,40 +623,23 @@ def test_return_interfaces(loginfo, logdebug):
         call("Returning interface list."),
     ]
     loginfo.assert_has_calls(loginfo_calls, any_order=False)
-    logdebug_calls = [
-        call(
-            "Adding interface parameters:"
-            " {'neighborDevice': 'DCBBW1', 'neighborPort': 'Ethernet1', 'port': 'Ethernet1'}"
-            " neighbor for: DSR01"
-        ),
-        call(
-            "Adding interface parameters:"
-            " {'neighborDevice': 'DCBBW2', 'neighborPort': 'Ethernet1', 'port': 'Ethernet2'}"
-            " neighbor for: DSR01"
-        ),
-        call(
-            "Adding interface parameters:"
-            " {'neighborDevice': 'DCBBE1', 'neighborPort': 'Ethernet1', 'port': 'Ethernet3'}"
-            " neighbor for: DSR01"
-        ),
-        call(
-            "Adding interface parameters:"
-            " {'neighborDevice': 'DCBBE2', 'neighborPort': 'Ethernet1', 'port': 'Ethernet4'}"
-            " neighbor for: DSR01"
-        ),
-        call(
-            "Returning interface list:"
-            " [{'hostname': 'DSR01', 'interface_name': 'Ethernet1',"
-            " 'z_hostname': 'DCBBW1', 'z_interface_name': 'Ethernet1', 'media_type': ''},"
-            " {'hostname': 'DSR01', 'interface_name': 'Ethernet2',"
-            " 'z_hostname': 'DCBBW2', 'z_interface_name': 'Ethernet1', 'media_type': ''},"
-            " {'hostname': 'DSR01', 'interface_name': 'Ethernet3',"
-            " 'z_hostname': 'DCBBE1', 'z_interface_name': 'Ethernet1', 'media_type': ''},"
-            " {'hostname': 'DSR01', 'interface_name': 'Ethernet4',"
-            " 'z_hostname': 'DCBBE2', 'z_interface_name': 'Ethernet1', 'media_type': ''}]"
-        ),
-    ]
-    logdebug.assert_has_calls(logdebug_calls, any_order=False)
+    logdebug.assert_called_with("Returning interface list: %s", excepted_output)
+
+
+def test_return_interfaces_indexed():
+    """Validates interfaces are indexed once per test parameters and returned as copies
+    FIXTURE NEEDED: fixture_duts.yaml"""
+    test_parameters = read_yaml("tests/unittests/fixtures/fixture_duts.yaml")
+    first_output = tests_tools.return_interfaces("DSR01", test_parameters)
+    first_output[0]["media_type"] = "1000BASE-T"
+    first_output.pop()
+
+    test_parameters["duts"][0]["neighbors"] = []
+    second_output = tests_tools.return_interfaces("DSR01", test_parameters)
+    assert len(second_output) == 4
+    assert second_output[0]["media_type"] == ""
+
+    assert tests_tools.return_interfaces("UNKNOWN", test_parameters) == []
 
 
 def test_get_parameters(loginfo, logdebug):
@@ -614,37 +671,28 @@ def test_get_parameters(loginfo, logdebug):
     loginfo.assert_has_calls(loginfo_calls, any_order=False)
 
     logdebug_calls = [
-        call(
-            "Suite_parameters:"
-            " [{'name': 'test_aaa.py',"
-            " 'testcases': [{'name': 'test_if_authentication_counters_are_incrementing_on_',"
-            " 'description': 'Verify AAA counters are working correctly',"
-            " 'show_cmds': ['show lldp neighbors', 'show aaa counters'], 'expected_output': None,"
-            " 'comment': None, 'result': True},"
-            " {'name': 'test_if_aaa_session_logging_is_working_on_',"
-            " 'description': 'Verify AAA session logging is working by"
-            " identifying eapi connection',"
-            " 'show_cmd': 'show users detail', 'expected_output': 'commandApi',"
-            " 'comment': None, 'result': True},"
-            " {'name': 'test_if_commands_authorization_methods_set_on_',"
-            " 'description': 'Verify AAA command authorization are method-lists set correct',"
-            " 'cmd_auth': ['none'], 'show_cmd': 'show aaa methods all', 'expected_output': None,"
-            " 'comment': None, 'result': True},"
-            " {'name': 'test_if_exec_authorization_methods_set_on_',"
-            " 'description': 'Verify AAA exec authorization are method-lists set correct',"
-            " 'exec_auth': ['none'], 'show_cmd': 'show aaa methods all', 'expected_output': None,"
-            " 'comment': None, 'result': True}], 'dir_path': 'sample_network_tests/aaa'}]"
-        ),
-        call(
-            "Case_parameters: {'name': 'test_if_exec_authorization_methods_set_on_',"
-            " 'description': 'Verify AAA exec authorization are method-lists set correct',"
-            " 'exec_auth': ['none'], 'show_cmd': 'show aaa methods all', 'expected_output': None,"
-            " 'comment': None, 'result': True}"
-        ),
+        call("Suite_parameters: [%s]", tests_parameters["test_suites"][0]),
+        call("Case_parameters: %s", expected_output),
     ]
     logdebug.assert_has_calls(logdebug_calls, any_order=False)
 
 
+def test_get_parameters_indexed():
+    """Validates test suites and test cases are only indexed once per test parameters
+    FIXTURES NEEDED: fixture_test_parameters.yaml"""
+    tests_parameters = read_yaml("tests/unittests/fixtures/fixture_test_parameters.yaml")
+    test_suite = "sample_network_tests/aaa/test_aaa.py"
+    test_case = "test_if_exec_authorization_methods_set_on_"
+
+    first_output = tests_tools.get_parameters(tests_parameters, test_suite, test_case)
+    tests_index = tests_tools.TESTS_INDEX_CACHE[id(tests_parameters)]
+    assert tests_index[0] is tests_parameters
+
+    second_output = tests_tools.get_parameters(tests_parameters, test_suite, test_case)
+    assert second_output is first_output
+    assert tests_tools.TESTS_INDEX_CACHE[id(tests_parameters)] is tests_index
+
+
 def test_verify_show_cmd_pass(loginfo, logdebug):
     """Validates verification of show commands being executed on given dut"""
     dut = {"output": {"show clock": ""}, "name": "Test Dut"}
@@ -725,36 +773,20 @@ def test_return_show_cmds(loginfo, logdebug):
     loginfo_calls = [
         call("Finding show commands in test suite: test_aaa.py"),
         call(
-            "The following show commands are required for test cases: "
-            "['show version', 'show lldp neighbors', 'show aaa counters', "
-            "'show users detail', 'show aaa methods all']"
+            "The following show commands are required for test cases: %s",
+            [
+                "show version",
+                "show lldp neighbors",
+                "show aaa counters",
+                "show users detail",
+                "show aaa methods all",
+            ],
         ),
     ]
     loginfo.assert_has_calls(loginfo_calls, any_order=False)
 
     logdebug_calls = [
-        call(
-            "Discover the names of test suites from"
-            " {'test_suites':"
-            " [{'name': 'test_aaa.py',"
-            " 'testcases': [{'name': 'test_if_authentication_counters_are_incrementing_on_',"
-            " 'description': 'Verify AAA counters are working correctly',"
-            " 'show_cmds': ['show lldp neighbors', 'show aaa counters'], 'expected_output': None,"
-            " 'comment': None, 'result': True},"
-            " {'name': 'test_if_aaa_session_logging_is_working_on_',"
-            " 'description': 'Verify AAA session logging is working by"
-            " identifying eapi connection',"
-            " 'show_cmd': 'show users detail', 'expected_output': 'commandApi',"
-            " 'comment': None, 'result': True},"
-            " {'name': 'test_if_commands_authorization_methods_set_on_',"
-            " 'description': 'Verify AAA command authorization are method-lists set correct',"
-            " 'cmd_auth': ['none'], 'show_cmd': 'show aaa methods all', 'expected_output': None,"
-            " 'comment': None, 'result': True},"
-            " {'name': 'test_if_exec_authorization_methods_set_on_',"
-            " 'description': 'Verify AAA exec authorization are method-lists set correct',"
-            " 'exec_auth': ['none'], 'show_cmd': 'show aaa methods all', 'expected_output': None,"
-            " 'comment': None, 'result': True}], 'dir_path': 'sample_network_tests/aaa'}]}"
-        ),
+        call("Discover the names of test suites from %s", test_parameters),
         call("Found show commands ['show lldp neighbors', 'show aaa counters']"),
         call("Adding Show commands show lldp neighbors"),
         call("Adding Show commands show aaa counters"),
@@ -767,6 +799,19 @@ def test_return_show_cmds(loginfo, logdebug):
     logdebug.assert_has_calls(logdebug_calls, any_order=False)
 
 
+def test_walk_test_dirs():
+    """Validates test definition directories are found in the same order as os.walk"""
+    expected_dirs = [
+        dir_path
+        for dir_path, _, file_names in os.walk("sample_network_tests")
+        if "test_definition.yaml" in file_names
+    ]
+    actual_dirs = list(tests_tools._walk_test_dirs("sample_network_tests", "test_definition.yaml"))
+
+    assert expected_dirs
+    assert actual_dirs == expected_dirs
+
+
 def test_return_test_defs(logdebug):
     """Validates if test definitions are being generated correctly
     Creates a temporary reports/test_definition and deletes it before exiting
@@ -790,20 +835,41 @@ def test_return_test_defs(logdebug):
     assert actual_output == expected_output
 
     logdebug.assert_called_with(
-        "Return the following test definitions data structure "
-        "{'test_suites': [{'name': 'test_tacacs.py', "
-        "'testcases': [{'name': 'test_if_tacacs_is_sending_messages_on_', "
-        "'description': 'Verify tacacs messages are sending correctly', 'show_cmd': 'show tacacs', "
-        "'expected_output': None, 'report_style': 'modern', "
-        "'test_criteria': 'Verify tacacs messages are sending correctly', "
-        "'criteria': 'names', 'filter': ['DSR01', 'DCBBW1'], 'comment': None, 'result': True}, "
-        "{'name': 'test_if_tacacs_is_receiving_messages_on_', "
-        "'description': 'Verify tacacs messages are received correctly', "
-        "'show_cmd': 'show tacacs', "
-        "'expected_output': None, 'report_style': 'modern', "
-        "'test_criteria': 'Verify tacacs messages are received correctly', "
-        "'criteria': 'names', 'filter': ['DSR01', 'DCBBW1'], 'comment': None, 'result': True}], "
-        "'dir_path': 'tests/unittests/fixtures/fixture_tacacs'}]}"
+        "Return the following test definitions data structure %s",
+        {
+            "test_suites": [
+                {
+                    "name": "test_tacacs.py",
+                    "testcases": [
+                        {
+                            "name": "test_if_tacacs_is_sending_messages_on_",
+                            "description": "Verify tacacs messages are sending correctly",
+                            "show_cmd": "show tacacs",
+                            "expected_output": None,
+                            "report_style": "modern",
+                            "test_criteria": "Verify tacacs messages are sending correctly",
+                            "criteria": "names",
+                            "filter": ["DSR01", "DCBBW1"],
+                            "comment": None,
+                            "result": True,
+                        },
+                        {
+                            "name": "test_if_tacacs_is_receiving_messages_on_",
+                            "description": "Verify tacacs messages are received correctly",
+                            "show_cmd": "show tacacs",
+                            "expected_output": None,
+                            "report_style": "modern",
+                            "test_criteria": "Verify tacacs messages are received correctly",
+                            "criteria": "names",
+                            "filter": ["DSR01", "DCBBW1"],
+                            "comment": None,
+                            "result": True,
+                        },
+                    ],
+                    "dir_path": "tests/unittests/fixtures/fixture_tacacs",
+                }
+            ]
+        },
     )
     shutil.rmtree("reports", ignore_errors=True)
 
@@ -831,6 +897,48 @@ def test_export_yaml():
     os.remove(yaml_file)
 
 
+def test_export_json(tmp_path):
+    """Validates exporting of data into a json file and reading it back"""
+    json_file = str(tmp_path / "result-test_if_tacacs_is_sending_messages_on_-DSR01.json")
+    json_data = {
+        "name": "test_if_tacacs_is_sending_messages_on_",
+        "dut": "DSR01",
+        "test_result": True,
+        "show_cmd": ["show tacacs"],
+        "fail_or_skip_reason": None,
+    }
+    tests_tools.export_json(json_file, json_data)
+
+    # check if json file got written to correctly
+    assert tests_tools.json_read(json_file) == json_data
+
+
+def test_export_json_tuple_keys(tmp_path):
+    """Validates dict keys json cannot encode are written as strings"""
+    json_file = str(tmp_path / "result-test_if_intf_counters_are_clear_on_-DSR01.json")
+    json_data = {"actual_output": {("Ethernet1", "Ethernet2"): 0, 1: "up"}}
+
+    tests_tools.export_json(json_file, json_data)
+
+    assert tests_tools.json_read(json_file) == {
+        "actual_output": {"('Ethernet1', 'Ethernet2')": 0, "1": "up"}
+    }
+
+
+def test_export_json_error(tmp_path, logerror, mocker):
+    """Validates data json cannot encode is logged and exits the test runner"""
+    json_file = str(tmp_path / "result-test_if_intf_counters_are_clear_on_-DSR01.json")
+    mocker.patch("vane.tests_tools.json.dump", side_effect=ValueError("Out of range float"))
+
+    with pytest.raises(SystemExit) as exit_info:
+        tests_tools.export_json(json_file, {"dut": "DSR01"})
+
+    assert exit_info.value.code == 1
+    logerror.assert_has_calls(
+        [call("ERROR IN JSON FILE: Out of range float"), call("EXITING TEST RUNNER")]
+    )
+
+
 def test_export_text():
     """Validates exporting of data to text file"""
     text_file = "text/export_file.txt"
@@ -944,10 +1052,12 @@ OUTPUT = (
 def create_test_ops_instance(mocker):
     """Utility function to create tops object needed for testing TestOps methods"""
 
-    # creating test ops object and mocking inspect_stack call
-    mocker.patch("inspect.stack", return_value=["", ["", "", "", "test_memory_utilization_on_"]])
+    # creating test ops object from a function named after the test case, so
+    # TestOps picks the test case name up from its caller
+    def test_memory_utilization_on_():
+        return tests_tools.TestOps(TEST_DEFINITION, TEST_SUITE, DUT)
 
-    tops = tests_tools.TestOps(TEST_DEFINITION, TEST_SUITE, DUT)
+    tops = test_memory_utilization_on_()
 
     return tops
 
@@ -1000,11 +1110,11 @@ def test_test_ops_constructor(mocker):
     assert tops.report_dir == "reports"
 
     assert tops.show_cmds == {"DCBBW1": ["show version"]}
-    assert tops._show_cmds == {"DCBBW1": ["show version", "show version"]}
+    assert tops._show_cmds == {"DCBBW1": ["show version"]}
     assert tops.show_cmd == "show version"
 
     assert tops.show_cmd_txts == {"DCBBW1": [OUTPUT]}
-    assert tops._show_cmd_txts == {"DCBBW1": [OUTPUT, OUTPUT]}
+    assert tops._show_cmd_txts == {"DCBBW1": [OUTPUT]}
 
     assert tops.show_cmd_txt == OUTPUT
 
@@ -1075,9 +1185,9 @@ def test_test_ops_write_results(loginfo, logdebug, mocker):
     )
     mocker.patch("vane.tests_tools.TestOps._verify_show_cmd", return_value=True)
 
-    # mocking call to export_yaml
+    # mocking call to export_json
 
-    mocker_object = mocker.patch("vane.tests_tools.export_yaml")
+    mocker_object = mocker.patch("vane.tests_tools.export_json")
 
     tops = create_test_ops_instance(mocker)
     tops._write_results()
@@ -1086,14 +1196,14 @@ def test_test_ops_write_results(loginfo, logdebug, mocker):
 
     loginfo.assert_called_with("Preparing to write results")
     logdebug.assert_called_with(
-        "Creating results file named reports/results/result-test_memory_utilization_on_-DSR01.yml"
+        "Creating results file named reports/results/result-test_memory_utilization_on_-DSR01.json"
     )
 
-    # assert export_yaml got called with correctly processed arguments
+    # assert export_json got called with correctly processed arguments
 
     test_params = read_yaml("tests/unittests/fixtures/fixture_testops_test_parameters.yaml")
     mocker_object.assert_called_once_with(
-        "reports/results/result-test_memory_utilization_on_-DSR01.yml", test_params
+        "reports/results/result-test_memory_utilization_on_-DSR01.json", test_params
     )
 
 
@@ -1120,7 +1230,6 @@ def test_test_ops_write_text_results(mocker):
     text_file = "reports/TEST RESULTS/1 test_memory_utilization_on_/1 DCBBW1 Verification.txt"
     text_data = {
         "1. DCBBW1# show version": "\n\n" + OUTPUT,
-        "2. DCBBW1# show version": "\n\n" + OUTPUT,
     }
     dut_name = "DCBBW1"
     mocker_object.assert_called_once_with(text_file, text_data, dut_name)
@@ -1160,21 +1269,39 @@ def test_test_ops_get_parameters(loginfo, logdebug, mocker):
     logdebug_calls = [
         call("Return testcases for Test Suite: test_memory.py"),
         call(
-            "Suite_parameters: [{'name': 'test_memory.py', 'testcases': "
-            "[{'name': 'test_memory_utilization_on_', "
-            "'description': 'Verify memory is not exceeding high utilization', "
-            "'show_cmd': 'show version', 'expected_output': 80, 'report_style': 'modern', "
-            "'test_criteria': 'Verify memory is not exceeding high utilization', "
-            "'criteria': 'names', 'filter': ['DSR01', 'DCBBW1'], 'comment': None, "
-            "'result': True}]}]"
+            "Suite_parameters: [%s]",
+            {
+                "name": "test_memory.py",
+                "testcases": [
+                    {
+                        "name": "test_memory_utilization_on_",
+                        "description": "Verify memory is not exceeding high utilization",
+                        "show_cmd": "show version",
+                        "expected_output": 80,
+                        "report_style": "modern",
+                        "test_criteria": "Verify memory is not exceeding high utilization",
+                        "criteria": "names",
+                        "filter": ["DSR01", "DCBBW1"],
+                        "comment": None,
+                        "result": True,
+                    }
+                ],
+            },
         ),
         call(
-            "Case_parameters: {'name': 'test_memory_utilization_on_', "
-            "'description': 'Verify memory is not exceeding high utilization', "
-            "'show_cmd': 'show version', 'expected_output': 80, 'report_style': 'modern', "
-            "'test_criteria': 'Verify memory is not exceeding high utilization', "
-            "'criteria': 'names', 'filter': ['DSR01', 'DCBBW1'], 'comment': None, "
-            "'result': True}"
+            "Case_parameters: %s",
+            {
+                "name": "test_memory_utilization_on_",
+                "description": "Verify memory is not exceeding high utilization",
+                "show_cmd": "show version",
+                "expected_output": 80,
+                "report_style": "modern",
+                "test_criteria": "Verify memory is not exceeding high utilization",
+                "criteria": "names",
+                "filter": ["DSR01", "DCBBW1"],
+                "comment": None,
+                "result": True,
+            },
         ),
     ]
     logdebug.assert_has_calls(logdebug_calls, any_order=False)
@@ -1212,11 +1339,10 @@ def test_test_ops_generate_report(logdebug, mocker):
         "show_cmd_txts": {
             "DCBBW1": [
                 OUTPUT,
-                OUTPUT,
             ]
         },
         "test_steps": [],
-        "show_cmds": {"DCBBW1": ["show version", "show version"]},
+        "show_cmds": {"DCBBW1": ["show version"]},
         "fail_or_skip_reason": "",
     }
 
@@ -1230,7 +1356,9 @@ def test_test_ops_generate_report(logdebug, mocker):
     mocker_object_two.assert_called_once()
     mocker_object_three.assert_called_once()
 
-    logdebug.assert_called_with("Output on device DCBBW1 after SSH connection is: Output")
+    logdebug.assert_called_with(
+        "Output on device %s after SSH connection is: %s", "DCBBW1", "Output"
+    )
 
 
 def test_test_ops_html_report(mocker, capsys):
@@ -1250,7 +1378,7 @@ def test_test_ops_html_report(mocker, capsys):
 
     show_output = (
         f"SHOW OUTPUT COLLECTED IN TEST CASE:\n===================================\n"
-        f"1. DCBBW1# show version\n\n{OUTPUT}\n2. DCBBW1# show version\n\n{OUTPUT}"
+        f"1. DCBBW1# show version\n\n{OUTPUT}"
     )
 
     # Assert that the expected prints occurred
@@ -1315,11 +1443,13 @@ def test_test_ops_parse_test_steps(loginfo, mocker):
 
     # assert the test steps log call
     loginfo.assert_called_with(
-        "These are test steps "
-        "[' Creating Testops class object and initializing the variable', "
-        "' Running Tcpdump on syslog server and entering in config mode\\n"
-        "             and existing to verify logging event are captured.',"
-        " ' Comparing the actual output and expected output. Generating docx report']"
+        "These are test steps %s",
+        [
+            " Creating Testops class object and initializing the variable",
+            " Running Tcpdump on syslog server and entering in config mode\n"
+            "             and existing to verify logging event are captured.",
+            " Comparing the actual output and expected output. Generating docx report",
+        ],
     )
 
 
@@ -1377,12 +1507,12 @@ def test_test_ops_run_show_cmds_json(mocker):
     ]
     assert tops.show_cmds == show_cmds
     assert tops._show_cmds == {
-        "DCBBW1": ["show version", "show version"],
+        "DCBBW1": ["show version"],
         "neighbor": ["show clock", "show interfaces status"],
     }
 
     assert tops._show_cmd_txts == {
-        "DCBBW1": [OUTPUT, OUTPUT],
+        "DCBBW1": [OUTPUT],
         "neighbor": [
             "Thu Jun  1 14:03:59 2023\nTimezone: UTC\nClock source: local\n",
             "TEXT_INTERFACE_STATUS_result",
@@ -1434,14 +1564,13 @@ def test_test_ops_run_show_cmds_text(mocker):
     ]
     assert tops.show_cmds == ["show lldp neighbors", "show interfaces status"]
     assert tops._show_cmds == {
-        "DCBBW1": ["show version", "show version"],
+        "DCBBW1": ["show version"],
         "neighbor": ["show lldp neighbors", "show interfaces status"],
     }
 
     assert tops._show_cmd_txts == {
         "DCBBW1": [
             OUTPUT,
-            OUTPUT,
         ],
         "neighbor": ["TEXT_result", "TEXT_result"],
     }
@@ -1500,6 +1629,64 @@ def test_test_ops_run_show_cmds_text_exception_fail(mocker):
     assert tops._show_cmd_txts["neighbor"] == ["Error [1000]: Invalid command [None]"]
 
 
+def test_test_ops_run_show_cmds_per_cmd_on_error(mocker):
+    """Validates a failed batch is run one command at a time and recorded once"""
+    mocker.patch(
+        "vane.tests_tools.TestOps._get_parameters",
+        return_value=read_yaml("tests/unittests/fixtures/fixture_testops_test_parameters.yaml"),
+    )
+    mocker.patch("vane.tests_tools.TestOps._verify_show_cmd", return_value=True)
+
+    file_error = pyeapi.eapilib.CommandError(1000, "File not found")
+    mocker_object = mocker.patch("vane.device_interface.PyeapiConn.enable")
+    mocker_object.side_effect = [
+        file_error,
+        [
+            {
+                "command": "show file information flash:/startup-config",
+                "result": {"isDir": False},
+                "encoding": "json",
+            }
+        ],
+        [
+            {
+                "command": "show file information flash:/startup-config",
+                "result": {"output": "TEXT_FILE_result"},
+                "encoding": "text",
+            }
+        ],
+        file_error,
+    ]
+
+    tops = create_test_ops_instance(mocker)
+
+    dut = {"connection": vane.device_interface.PyeapiConn, "name": "neighbor"}
+    dut["eapi_conn"] = dut["connection"]
+    tops.show_clock_flag = False
+    show_cmds = [
+        "show file information flash:/startup-config",
+        "show file information flash:/missing",
+    ]
+
+    actual_output = tops.run_show_cmds_per_cmd_on_error(show_cmds, dut)
+
+    assert actual_output == [
+        {
+            "command": "show file information flash:/startup-config",
+            "result": {"isDir": False},
+            "encoding": "json",
+        },
+        file_error,
+    ]
+
+    # the failed batch is not part of the evidence, each command is recorded once
+    assert tops._show_cmds["neighbor"] == show_cmds
+    assert tops._show_cmd_txts["neighbor"] == [
+        "TEXT_FILE_result",
+        "Error [1000]: File not found [None]",
+    ]
+
+
 def test_test_ops_run_cfg_cmds_pyeapi(mocker):
     """Validates the functionality of run_show_cmds method"""
     mocker.patch(
@@ -1541,12 +1728,12 @@ def test_test_ops_run_cfg_cmds_pyeapi(mocker):
         {},
     ]
     assert tops._show_cmds == {
-        "DCBBW1": ["show version", "show version"],
+        "DCBBW1": ["show version"],
         "neighbor": ["show clock", "interface eth16", "description unittest"],
     }
 
     assert tops._show_cmd_txts == {
-        "DCBBW1": [OUTPUT, OUTPUT],
+        "DCBBW1": [OUTPUT],
         "neighbor": ["Thu Jun  1 14:03:59 2023\nTimezone: UTC\nClock source: local\n", "", ""],
     }
 
@@ -1593,12 +1780,12 @@ def test_test_ops_run_cfg_cmds_ssh(mocker):
     assert actual_output == config_return_value
 
     assert tops._show_cmds == {
-        "DCBBW1": ["show version", "show version"],
+        "DCBBW1": ["show version"],
         "neighbor": ["show clock", "interface eth16", "description unittest"],
     }
 
     assert tops._show_cmd_txts == {
-        "DCBBW1": [OUTPUT, OUTPUT],
+        "DCBBW1": [OUTPUT],
         "neighbor": [
             "Thu Jun  1 14:03:59 2023\nTimezone: UTC\nClock source: local\n",
             config_return_value,
@@ -1684,7 +1871,7 @@ def test_test_ops_transfer_file(mocker):
         "file_verified": True,
     }
     assert tops._show_cmds == {
-        "DCBBW1": ["show version", "show version"],
+        "DCBBW1": ["show version"],
         "neighbor": [
             "show clock",
             "sftp src_file: sample.txt dest_file: sample-20230816-145133.txt op: get",
@@ -1692,7 +1879,7 @@ def test_test_ops_transfer_file(mocker):
     }
 
     assert tops._show_cmd_txts == {
-        "DCBBW1": [OUTPUT, OUTPUT],
+        "DCBBW1": [OUTPUT],
         "neighbor": [
             "Thu Jun  1 14:03:59 2023\nTimezone: UTC\nClock source: local\n",
             file_tranfer_log,
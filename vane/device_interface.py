@@ -35,7 +35,9 @@
 """
 
 import os
+import http.client
 import json
+import socket
 import pyeapi
 import netmiko
 import paramiko
@@ -145,6 +147,132 @@ class PyeapiConn(DeviceConn):
         )
         if device_data.get("enable_pwd", ""):
             self._connection.enable_authentication(device_data["enable_pwd"])
+        self._keep_alive(self._connection.connection)
+
+    @staticmethod
+    def _keep_alive(eapi_conn):
+        """Keep the HTTP(S) connection to the device open between eAPI requests
+
+        pyeapi closes its transport after every request, so each request pays
+        for a new TCP connection and TLS handshake. The transport close is
+        deferred so http.client reuses the socket, unless the device answered
+        with Connection: close. A reused socket the device dropped while idle
+        is retried once on a fresh connection when the request can safely be
+        sent again, see _can_resend. TCP keepalive is enabled on each new
+        socket so it survives idle gaps between requests; http.client already
+        disables Nagle's algorithm on connect.
+
+        Args:
+            eapi_conn (EapiConnection): pyeapi connection of the node
+        """
+        send = eapi_conn.send
+        transport = eapi_conn.transport
+        connect = transport.connect
+        endheaders = transport.endheaders
+        getresponse = transport.getresponse
+        request_state = {}
+
+        def connect_keep_alive():
+            connect()
+            try:
+                transport.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            except (AttributeError, OSError):
+                pass
+
+        def endheaders_keep_alive(*args, **kwargs):
+            endheaders(*args, **kwargs)
+            request_state["request_sent"] = True
+
+        def getresponse_keep_alive():
+            response = getresponse()
+            request_state["response_started"] = True
+            request_state["will_close"] = response.will_close
+            return response
+
+        def close_keep_alive():
+            # the device is dropping the connection, close it for real
+            if request_state["will_close"]:
+                del transport.close
+                transport.close()
+
+        def send_keep_alive(data):
+            retries = 1 if transport.sock is not None else 0
+            while True:
+                request_state.update(request_sent=False, response_started=False, will_close=False)
+                eapi_conn.socket_error = None
+                transport.close = close_keep_alive
+                try:
+                    return send(data)
+                except pyeapi.eapilib.ConnectionError:
+                    transport.__dict__.pop("close", None)
+                    transport.close()
+                    if not retries or not PyeapiConn._can_resend(
+                        data,
+                        eapi_conn.socket_error,
+                        request_state["request_sent"],
+                        request_state["response_started"],
+                    ):
+                        raise
+                    retries -= 1
+                finally:
+                    transport.__dict__.pop("close", None)
+
+        transport.connect = connect_keep_alive
+        transport.endheaders = endheaders_keep_alive
+        transport.getresponse = getresponse_keep_alive
+        eapi_conn.send = send_keep_alive
+
+    @staticmethod
+    def _can_resend(data, socket_error, request_sent, response_started):
+        """Return True when a request that failed on a reused socket can be sent again
+
+        A broken pipe or reset while sending means the request never reached
+        the device. A disconnect after the request was sent may come after
+        the device ran the commands, so only requests of show commands are
+        sent again then. Timeouts and failures after a response started are
+        never retried.
+
+        Args:
+            data (str): JSON-RPC body of the eAPI request
+            socket_error (OSError): socket error recorded by pyeapi, if any
+            request_sent (bool): whether the request body was handed to the socket
+            response_started (bool): whether a response status was received
+
+        Returns:
+            bool: True if the request can safely be sent again
+        """
+        if response_started or isinstance(socket_error, socket.timeout):
+            return False
+
+        if not request_sent:
+            return isinstance(socket_error, (BrokenPipeError, ConnectionResetError))
+
+        return isinstance(
+            socket_error, (http.client.RemoteDisconnected, ConnectionResetError)
+        ) and PyeapiConn._show_only(data)
+
+    @staticmethod
+    def _show_only(data):
+        """Return True when an eAPI request only runs show commands
+
+        Args:
+            data (str): JSON-RPC body of the eAPI request
+
+        Returns:
+            bool: True if every command is enable or a show command
+        """
+        try:
+            cmds = json.loads(data)["params"]["cmds"]
+        except (ValueError, TypeError, LookupError):
+            return False
+
+        for cmd in cmds:
+            if isinstance(cmd, dict):
+                cmd = cmd.get("cmd", "")
+            if not isinstance(cmd, str) or not (cmd == "enable" or cmd.startswith("show ")):
+                return False
+
+        return True
 
     def run_commands(self, cmds, encoding="json", send_enable=True, **kwargs):
         """wrapper around pyeapi run_commands func"""
@@ -42,7 +42,7 @@ from docx.oxml.ns import qn, nsdecls
 from docx.oxml import OxmlElement, parse_xml
 from docx.shared import Inches, Pt, RGBColor
 from vane.report_templates import REPORT_TEMPLATES
-from vane.tests_tools import yaml_read
+from vane.tests_tools import json_read, yaml_read
 from vane.vane_logging import logging
 
 TABLE_GRID = "Table Grid"
@@ -65,15 +65,15 @@ class ReportClient:
 
         logging.info("Reading YAML data-model and converting into a Python data structure")
         self.data_model = yaml_read(test_definition)
-        logging.debug(f"Internal test data-model initialized with value: {self.data_model}")
+        logging.debug("Internal test data-model initialized with value: %s", self.data_model)
         self._summary_results = self._compile_test_results()
-        logging.debug(f"Test Results: {self._summary_results}")
+        logging.debug("Test Results: %s", self._summary_results)
 
         self._reports_dir = self.data_model["parameters"]["report_dir"]
         _results_dir = self.data_model["parameters"]["results_dir"]
         self._results_datamodel = None
         self._compile_yaml_data(_results_dir)
-        logging.debug(f"Results file data is {self._results_datamodel}")
+        logging.debug("Results file data is %s", self._results_datamodel)
 
         self._document = docx.Document()
         section = self._document.sections[0]
@@ -97,13 +97,16 @@ class ReportClient:
         for name in yaml_files:
             if "result-" in name:
                 yaml_file = f"{yaml_dir}/{name}"
-                yaml_data = yaml_read(yaml_file)
+                if name.endswith(".json"):
+                    yaml_data = json_read(yaml_file)
+                else:
+                    yaml_data = yaml_read(yaml_file)
 
                 self._reconcile_results(yaml_data)
             else:
                 logging.error(f"Incorrect filename: {name}")
 
-        logging.debug(f"Updated results_data to {self._results_datamodel}")
+        logging.debug("Updated results_data to %s", self._results_datamodel)
 
     def _reconcile_results(self, test_parameters):
         """Validate test case results data and reconciles any missing data
@@ -366,11 +369,11 @@ class ReportClient:
             logging.debug(f"Raw json report is {json_file}")
             test_data = json.load(json_file)
             tests = test_data["report"]["tests"]
-            logging.debug(f"Structured json report is {test_data}")
+            logging.debug("Structured json report is %s", test_data)
 
             summary = test_data["report"]["summary"]
             test_results["summaryResults"] = summary
-            logging.debug(f"Summary for test cases are {summary}")
+            logging.debug("Summary for test cases are %s", summary)
             test_results["duts"] = self._parse_testcases(tests)
 
         return test_results
@@ -415,7 +418,7 @@ class ReportClient:
 
                 testcases_results[dut_index]["TOTAL"] += 1
 
-        logging.debug(f"DUT compiled results: {testcases_results}")
+        logging.debug("DUT compiled results: %s", testcases_results)
 
         return testcases_results
 
@@ -710,11 +713,11 @@ class ReportClient:
                         tbl_value = self._return_tbl_value(dut, tbl_header)
                         testcase_result[tbl_header] = tbl_value
 
-                    logging.debug(f"Compiled DUT results: {testcase_result}")
+                    logging.debug("Compiled DUT results: %s", testcase_result)
                     testcase_results.append(testcase_result)
 
         logging.info("Returning testcase result")
-        logging.debug(f"Returning testcase result {testcase_results}")
+        logging.debug("Returning testcase result %s", testcase_results)
         return testcase_results
 
     def _return_tbl_value(self, dut, tbl_header):
@@ -727,7 +730,7 @@ class ReportClient:
         Returns:
             str: Test case value for summary header
         """
-        logging.debug(f"dut data structure set to: {dut}")
+        logging.debug("dut data structure set to: %s", dut)
         if tbl_header in dut:
             tbl_value = dut[tbl_header]
             logging.debug(f"{tbl_header} set to {tbl_value} in dut structure")
@@ -834,7 +837,7 @@ class ReportClient:
             dut_section (int): DUT section number
         """
 
-        logging.debug(f"Raw DUT data is {dut}")
+        logging.debug("Raw DUT data is %s", dut)
         dut_name = dut["dut"]
         dut_name = dut_name.upper()
         tc_name = dut["name"]
@@ -1178,7 +1181,7 @@ class ReportClient:
 
                     dut_name = dut["dut"]
                     fail_reason = dut["fail_or_skip_reason"]
-                    logging.debug(f"Compiling results for DUT/s {dut_name}")
+                    logging.debug("Compiling results for DUT/s %s", dut_name)
                     testcase_id = dut["test_id"]
 
                     if dut["test_result"] and dut["test_result"] == "Skipped":
@@ -1195,14 +1198,14 @@ class ReportClient:
                     testcase_result["dut"] = dut_name
                     testcase_result["results"] = test_result
                     testcase_result["fail_or_skip_reason"] = fail_reason
-                    logging.debug(f"Compiled results: {testcase_result}")
+                    logging.debug("Compiled results: %s", testcase_result)
 
                     testcase_results.append(testcase_result)
-                    logging.debug(f"After testcase results struct appended: {testcase_results}")
+                    logging.debug("After testcase results struct appended: %s", testcase_results)
 
-                logging.debug(f"Interim dut -- testcase results struct {testcase_results}")
+                logging.debug("Interim dut -- testcase results struct %s", testcase_results)
 
-        logging.debug(f"Returning testcase result {testcase_results}")
+        logging.debug("Returning testcase result %s", testcase_results)
         return testcase_results
 
     def _format_ts_name(self, ts_name):
@@ -31,14 +31,82 @@
 
 """Utilities for using PyTest in network testing"""
 
+import concurrent.futures
+import itertools
 import os
 import json
-import re
-from pathlib import Path
+import mmap
 import datetime
-from mdutils.mdutils import MdUtils
 from vane.vane_logging import logging
 
+# Markers opening a test step or definition and markers closing it
+TS_TD_STARTS = ("TS:", "TD:")
+TS_TD_ENDS = ('"""', "Args:")
+TS_TD_BYTES_STARTS = tuple(marker.encode() for marker in TS_TD_STARTS)
+TS_TD_BYTES_ENDS = tuple(marker.encode() for marker in TS_TD_ENDS)
+
+
+def find_test_steps(content, starts=TS_TD_STARTS, ends=TS_TD_ENDS):
+    """Find the test steps and definitions in content with a single forward
+    scan. Each one runs from a TS: or TD: marker up to the nearest following
+    triple quote or Args:, without backtracking over the text in between
+
+    Args:
+        content (str): Text to scan, or bytes like content with bytes markers
+        starts (tuple): Markers opening a test step or definition
+        ends (tuple): Markers closing a test step or definition
+
+    Returns:
+        comments (list): Test steps and definitions, each running from its
+        opening marker up to its closing marker
+    """
+    comments = []
+    marker_cache = dict.fromkeys(starts + ends)
+    pos = 0
+
+    while True:
+        start_pos, start = _next_marker(content, starts, marker_cache, pos)
+        if start is None:
+            break
+
+        end_pos, end = _next_marker(content, ends, marker_cache, start_pos + len(start))
+        if end is None:
+            break
+
+        comments.append(content[start_pos:end_pos])
+        pos = end_pos + len(end)
+
+    return comments
+
+
+def _next_marker(content, markers, marker_cache, from_pos):
+    """Return the position and value of the first of markers at or after from_pos
+
+    marker_cache holds the last found position of each marker (-1 once it is
+    not found), so each marker is only searched for again after the scan
+    has moved past it and content is read once per marker.
+
+    Args:
+        content (str): Text to scan
+        markers (tuple): Markers to look for
+        marker_cache (dict): Last found position of each marker
+        from_pos (int): Position to search from
+
+    Returns:
+        tuple: position and value of the first marker, (-1, None) if there is none
+    """
+    first_pos, first_marker = -1, None
+
+    for marker in markers:
+        marker_pos = marker_cache[marker]
+        if marker_pos is None or 0 <= marker_pos < from_pos:
+            marker_pos = marker_cache[marker] = content.find(marker, from_pos)
+
+        if marker_pos != -1 and (first_marker is None or marker_pos < first_pos):
+            first_pos, first_marker = marker_pos, marker
+
+    return first_pos, first_marker
+
 
 class TestStepClient:
     """Creates instance of Test Step Client."""
@@ -62,22 +130,48 @@ class TestStepClient:
         logging.info("Ending writing test case steps")
 
     def walk_dir(self):
-        """Walks through each directory"""
+        """Walks through each directory and parses the test files found, a test
+        file reachable from more than one directory is only parsed once"""
+        # real path of each test file mapped to the first path it was found at
+        test_files = {}
         for test_dir in self._test_dirs:
             logging.debug(f"Walking directory {test_dir} for test cases")
-            test_files = []
-            for root, _dirs, files in os.walk(test_dir, topdown=False):
-                logging.debug(f"Discovered files {files} in directory {test_dir}")
-                test_files.extend(
-                    os.path.join(root, name)
-                    for name in files
-                    if name.startswith("test_")
-                    and name.endswith(".py")
-                    or name.endswith("_test.py")
-                )
-
-            logging.debug(f"Discovered test files: {test_files} for parsing")
-            self.parse_file(test_files)
+            for entry in self._scan_dir(test_dir):
+                test_files.setdefault(os.path.realpath(entry.path), entry.path)
+
+        test_files = sorted(test_files.values())
+        logging.debug("Discovered test files: %s for parsing", test_files)
+        self.parse_file(test_files)
+
+    def _scan_dir(self, test_dir):
+        """Yield the file entry of every test file under test_dir
+
+        Args:
+            test_dir (str): directory to walk
+
+        Yields:
+            entry (os.DirEntry): test_*.py or *_test.py file entry
+        """
+        dir_stack = [test_dir]
+
+        while dir_stack:
+            dir_path = dir_stack.pop()
+            logging.debug("Scanning directory %s for test files", dir_path)
+
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            dir_stack.append(entry.path)
+                        # match on the name before is_file, which stats symlinks
+                        elif (
+                            entry.name.endswith(".py")
+                            and (entry.name.startswith("test_") or entry.name.endswith("_test.py"))
+                            and entry.is_file()
+                        ):
+                            yield entry
+            except OSError as err:
+                logging.debug("Unable to scan directory %s: %s", dir_path, err)
 
     def now(self):
         """Return current date and time"""
@@ -91,24 +185,70 @@ class TestStepClient:
             test_files (list): List of test file names collected directory walk
         """
         logging.info("Parsing files for test steps and definitions")
-        for test_file in test_files:
-            logging.debug(f"Parsing file: {test_file} for test steps and definitions")
-            comments = []
-            with open(test_file, "r", encoding="utf_8") as infile:
-                content = infile.read()
-            # Pattern to match to extract TS/TD
-            pattern = re.compile('(T[SD]:.*?)(?:"""|Args:)', re.DOTALL)
-            # Find all matches to pattern
-            comments = pattern.findall(content)
-            # Format each item in list
-            comments = [x.strip() for x in comments]
-            if not comments:
-                comments.append("N/a no Test Steps found")
-            comments.insert(0, self.now())
-
-            logging.debug(f"Create JSON and MD files for {test_file} using {comments}")
-            self.output_json({test_file: comments})
-            self.output_md({test_file: comments})
+        # all files parsed in one run share the run's date generated
+        date_generated = self.now()
+
+        # files are independent of each other, parse them concurrently and
+        # write their outputs back to back, in test file order, from this thread
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(32, len(test_files) or 1)
+        ) as executor:
+            for test_file, comments in zip(
+                test_files,
+                executor.map(self._parse_test_file, test_files, itertools.repeat(date_generated)),
+            ):
+                if comments is None:
+                    continue
+
+                logging.debug("Create JSON and MD files for %s using %s", test_file, comments)
+                self.output_steps(test_file, comments)
+
+    def _parse_test_file(self, test_file, date_generated):
+        """Parses a File for Test Steps & Definitions
+
+        Args:
+            test_file (str): Name of the test file
+            date_generated (str): date and time the test steps are generated
+
+        Returns:
+            comments (list): date generated followed by the test steps and
+            definitions of the file, None if the file could not be read
+        """
+        logging.debug(f"Parsing file: {test_file} for test steps and definitions")
+        comments = []
+        # Extract TS/TD from a memory map of the file rather than a copy of it
+        try:
+            with open(test_file, "rb") as infile, mmap.mmap(
+                infile.fileno(), 0, access=mmap.ACCESS_READ
+            ) as content:
+                comments = find_test_steps(content, TS_TD_BYTES_STARTS, TS_TD_BYTES_ENDS)
+        except ValueError:
+            # an empty file cannot be mapped and has no test steps
+            pass
+        except OSError as err:
+            logging.error(f"Unable to read test file {test_file}: {err}")
+            return None
+        # Format each item in list, translating newlines as text mode reads would
+        comments = [
+            x.decode("utf_8").replace("\r\n", "\n").replace("\r", "\n").strip() for x in comments
+        ]
+        if not comments:
+            comments.append("N/a no Test Steps found")
+        comments.insert(0, date_generated)
+
+        return comments
+
+    def output_steps(self, test_file, steps):
+        """Outputs Test steps & definitions of a test file to its json and MD
+        files, which share the test file's path without its extension
+
+        Args:
+            test_file (str): Name of the test file
+            steps (list): List of test steps or descriptions from test
+        """
+        file_base = os.path.splitext(test_file)[0]
+        self._write_json(file_base, test_file, steps)
+        self._write_md(file_base, steps)
 
     def output_json(self, test_comments):
         """Outputs Test steps & definitions to json file
@@ -117,9 +257,7 @@ class TestStepClient:
             test_comments (list): List of test steps or descriptions from test
         """
         for key in test_comments:
-            # Creates file with original filename into json directory
-            with open(f"{os.path.splitext(key)[0]}.json", "w+", encoding="utf_8") as outfile:
-                json.dump({key: test_comments.get(key)}, outfile)
+            self._write_json(os.path.splitext(key)[0], key, test_comments.get(key))
 
     def output_md(self, test_comments):
         """Output Test steps & definitions to MD File
@@ -128,27 +266,65 @@ class TestStepClient:
             test_comments (list): List of test steps or descriptions from test
         """
         for key in test_comments:
-            steps = test_comments.get(key)
-            md_file = MdUtils(file_name=f"{os.path.splitext(key)[0]}.md", title=Path(key).stem)
-            md_file.new_line(f"Date generated: {steps[0]}")
-            test_steps_list = []
-            for step in steps:
-                logging.debug(f"Checking step: {step} for TD or TS info")
-                # Create Title for Test Definition
-                if step.startswith("TD:"):
-                    # Add Test steps to Document where
-                    # there are more than one TD
-                    if test_steps_list:
-                        md_file.new_list(test_steps_list, marked_with="1")
-                        test_steps_list = []
-                    md_file.new_header(level=1, title=step.lstrip("TD:"))
-                # Add Test steps to list to be added to file
-                elif step.startswith("TS:"):
-                    test_steps_list.append(step.lstrip("TS:"))
-                # Add Test Steps to document when at end of items
-                if step == steps[-1]:
-                    md_file.new_list(test_steps_list, marked_with="1")
+            self._write_md(os.path.splitext(key)[0], test_comments.get(key))
+
+    def _write_json(self, file_base, key, steps):
+        """Write Test steps & definitions to {file_base}.json
+
+        Args:
+            file_base (str): Test file name without its extension
+            key (str): Name of the test file
+            steps (list): List of test steps or descriptions from test
+        """
+        # Serialize up front so the file is written with a single call
+        # rather than one write per JSON token
+        json_data = json.dumps({key: steps})
+        # Creates file with original filename into json directory
+        with open(f"{file_base}.json", "w", encoding="utf_8") as outfile:
+            outfile.write(json_data)
+
+    def _write_md(self, file_base, steps):
+        """Write Test steps & definitions to {file_base}.md
+
+        Args:
+            file_base (str): Test file name without its extension
+            steps (list): List of test steps or descriptions from test
+        """
+        # Build the markdown in memory and write it with a single call
+        title = os.path.basename(file_base)
+        md_parts = [f"\n{title}\n{'=' * len(title)}\n", f"  \nDate generated: {steps[0]}"]
+        test_steps_list = []
+        last_index = len(steps) - 1
+        for index, step in enumerate(steps):
+            logging.debug(f"Checking step: {step} for TD or TS info")
+            # Create Title for Test Definition
+            if step.startswith("TD:"):
+                # Add Test steps to Document where
+                # there are more than one TD
+                if test_steps_list:
+                    md_parts.append(self._md_list(test_steps_list))
                     test_steps_list = []
-                if step.startswith("N/a"):
-                    md_file.new_line(step)
-            md_file.create_md_file()
+                md_parts.append(f"\n# {step.removeprefix('TD:')}\n")
+            # Add Test steps to list to be added to file
+            elif step.startswith("TS:"):
+                test_steps_list.append(step.removeprefix("TS:"))
+            # Add Test Steps to document when at end of items
+            if index == last_index:
+                md_parts.append(self._md_list(test_steps_list))
+                test_steps_list = []
+            if step.startswith("N/a"):
+                md_parts.append(f"  \n{step}")
+
+        with open(f"{file_base}.md", "w", encoding="utf_8") as outfile:
+            outfile.write("".join(md_parts))
+
+    def _md_list(self, items):
+        """Return items as a numbered markdown list
+
+        Args:
+            items (list): List items
+
+        Returns:
+            str: markdown list, a blank line followed by one numbered line per item
+        """
+        return "\n" + "".join(f"{index}. {item}\n" for index, item in enumerate(items, 1))
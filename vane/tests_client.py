@@ -79,7 +79,7 @@ class TestsClient:
         self.data_model = tests_tools.import_yaml(test_definition)
         self.duts_model = tests_tools.import_yaml(test_duts)
 
-        logging.debug(f"Internal test data-model initialized with value: {self.data_model}")
+        logging.debug("Internal test data-model initialized with value: %s", self.data_model)
         self.test_parameters = []
 
     def write_test_def_file(
@@ -109,14 +109,21 @@ class TestsClient:
                         # file and replace the given templates
                         test_template = Template(str(template), undefined=NullUndefined)
                         master_template = Template(str(master_definitions), undefined=NullUndefined)
-                        replace_data = yaml.safe_load(master_template.render())
+                        replace_data = yaml.load(
+                            master_template.render(), Loader=tests_tools.YamlSafeLoader
+                        )
 
                         new = test_template.render(replace_data)
-                        yaml_new = yaml.safe_load(new)
+                        yaml_new = yaml.load(new, Loader=tests_tools.YamlSafeLoader)
 
                         new_file = os.path.join(root, test_definitions)
                         with open(new_file, "w", encoding="utf-8") as outfile:
-                            yaml.safe_dump(yaml_new, outfile, sort_keys=False)
+                            yaml.dump(
+                                yaml_new,
+                                outfile,
+                                Dumper=tests_tools.YamlSafeDumper,
+                                sort_keys=False,
+                            )
                         logging.info("Regenerated test definition files")
 
     def generate_test_definitions(self):
@@ -370,7 +377,7 @@ class TestsClient:
             os.makedirs(results_dir)
 
         results_files = os.listdir(results_dir)
-        logging.debug(f"Result files are {results_files}")
+        logging.debug("Result files are %s", results_files)
 
         for name in results_files:
             if "result-" in name:
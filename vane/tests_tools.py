@@ -32,23 +32,57 @@
 
 """Utilities for using PyTest in network testing"""
 
+import collections
 import copy
 import concurrent.futures
+import functools
 import sys
 import os
 import time
 import inspect
+import json
 import re
 import pprint
+import threading
 import yaml
 
 from jinja2 import Template
+from pyeapi.eapilib import EapiError
 from vane import config, device_interface
 from vane.vane_logging import logging
 
+# use the libyaml bindings when PyYAML was built with them, otherwise the
+# pure Python classes; vane modules load and dump YAML through these names
+try:
+    from yaml import (
+        CSafeLoader as YamlSafeLoader,
+        CDumper as YamlDumper,
+        CSafeDumper as YamlSafeDumper,
+    )
+except ImportError:
+    from yaml import (
+        SafeLoader as YamlSafeLoader,
+        Dumper as YamlDumper,
+        SafeDumper as YamlSafeDumper,
+    )
+
 
 DEFAULT_EOS_CONN = "eapi"
 
+# maximum number of show commands sent to a dut in one eAPI request
+SHOW_CMDS_BATCH_SIZE = 40
+
+# id(tests_parameters) -> (tests_parameters, test suites and test cases indexed by name)
+TESTS_INDEX_CACHE = {}
+
+# id(test_parameters) -> (test_parameters, interface connections indexed by hostname)
+INTERFACES_INDEX_CACHE = {}
+
+# (absolute path, st_mtime_ns, st_size) -> parsed yaml, least recently used first
+YAML_CACHE = collections.OrderedDict()
+YAML_CACHE_SIZE = 100
+YAML_CACHE_LOCK = threading.Lock()
+
 
 def filter_duts(duts, criteria="", dut_filter=""):
     """Filter duts based on a user provided criteria and a filter
@@ -121,7 +155,7 @@ def parametrize_duts(test_fname, test_defs, dut_objs):
 
             duts, ids = filter_duts(dut_objs, criteria, dut_filter)
 
-            logging.debug(f"Creating dut parameters.  \nDuts: {duts} \nIds: {ids}")
+            logging.debug("Creating dut parameters.  \nDuts: %s \nIds: %s", duts, ids)
 
             dut_parameters[testname] = {}
             dut_parameters[testname]["duts"] = duts
@@ -156,16 +190,45 @@ def import_yaml(yaml_file):
 def yaml_read(yaml_file):
     """Return a yaml data read from the yaml file
 
+    Parsed files are cached by path, inode, modification time and size, so a
+    file edited in place or replaced is parsed again.
+
     Args:
         yaml_file (file): Input yaml file to be read
 
     Returns:
         yaml_data (dict):Yaml data read from the file
     """
+    try:
+        file_stat = os.stat(yaml_file)
+        cache_key = (
+            os.path.abspath(yaml_file),
+            file_stat.st_ino,
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+        )
+    except OSError:
+        cache_key = None
+
+    with YAML_CACHE_LOCK:
+        cached_yaml = YAML_CACHE.get(cache_key)
+        if cached_yaml is not None:
+            YAML_CACHE.move_to_end(cache_key)
+
+    if cached_yaml is not None:
+        return copy.deepcopy(cached_yaml)
+
     with open(yaml_file, "r", encoding="utf-8") as input_yaml:
         try:
-            yaml_data = yaml.safe_load(input_yaml)
-            logging.debug(f"Inputted the following yaml: {yaml_data}")
+            yaml_data = yaml.load(input_yaml, Loader=YamlSafeLoader)
+            logging.debug("Inputted the following yaml: %s", yaml_data)
+
+            if cache_key:
+                with YAML_CACHE_LOCK:
+                    YAML_CACHE[cache_key] = copy.deepcopy(yaml_data)
+                    if len(YAML_CACHE) > YAML_CACHE_SIZE:
+                        YAML_CACHE.popitem(last=False)
+
             return yaml_data
         except yaml.YAMLError as err:
             print(">>> ERROR IN YAML FILE")
@@ -174,6 +237,28 @@ def yaml_read(yaml_file):
             sys.exit(1)
 
 
+def json_read(json_file):
+    """Return json data read from the json file
+
+    Args:
+        json_file (file): Input json file to be read
+
+    Returns:
+        json_data (dict): Json data read from the file
+    """
+    with open(json_file, "r", encoding="utf-8") as input_json:
+        try:
+            json_data = json.load(input_json)
+            logging.debug("Inputted the following json: %s", json_data)
+
+            return json_data
+        except json.JSONDecodeError as err:
+            print(">>> ERROR IN JSON FILE")
+            logging.error(f"ERROR IN JSON FILE: {err}")
+            logging.error("EXITING TEST RUNNER")
+            sys.exit(1)
+
+
 def init_duts(show_cmds, test_parameters, test_duts):
     """Use PS LLD spreadsheet to find interesting duts and then execute
     inputted show commands on each dut.  Return structured data of
@@ -198,8 +283,8 @@ def init_duts(show_cmds, test_parameters, test_duts):
     duts = login_duts(test_parameters, test_duts)
     workers = len(duts)
 
-    logging.debug(f"Duts login info: {duts} and create {workers} workers")
-    logging.debug(f"Passing the following show commands to workers: {show_cmds}")
+    logging.debug("Duts login info: %s and create %s workers", duts, workers)
+    logging.debug("Passing the following show commands to workers: %s", show_cmds)
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
         future_object = {
@@ -210,7 +295,7 @@ def init_duts(show_cmds, test_parameters, test_duts):
         logging.debug("Future object generated successfully")
 
     logging.info("Returning duts data structure")
-    logging.debug(f"Return duts data structure: {duts}")
+    logging.debug("Return duts data structure: %s", duts)
 
     return duts
 
@@ -229,59 +314,81 @@ def login_duts(test_parameters, test_duts):
     logging.info("Using eapi to connect to Arista switches for testing")
 
     duts = test_duts["duts"]
-    logins = []
 
     network_configs = {}
     if "network_configs" in test_parameters["parameters"]:
         if test_parameters["parameters"]["network_configs"]:
             network_configs = import_yaml(test_parameters["parameters"]["network_configs"])
 
+    eos_conn = test_parameters["parameters"].get("eos_conn", DEFAULT_EOS_CONN)
+    if eos_conn not in ("eapi", "ssh"):
+        raise ValueError(f"Invalid EOS conn type {eos_conn} specified")
+
     for dut in duts:
-        name = dut["name"]
-        login_index = len(logins)
-        logins.append({})
-        login_ptr = logins[login_index]
+        logging.info(f"Connecting to switch: {dut['name']}")
 
-        logging.info(f"Connecting to switch: {name}")
+    # connect to all duts concurrently, logins are kept in the order of duts
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(duts), 1)) as executor:
+        logins = list(
+            executor.map(
+                lambda dut: login_dut(dut, test_parameters, eos_conn, network_configs), duts
+            )
+        )
 
-        logging.debug(f"Connecting to switch: {name} using parameters: {dut}")
+    logging.debug("Returning duts logins: %s", logins)
 
-        eos_conn = test_parameters["parameters"].get("eos_conn", DEFAULT_EOS_CONN)
-        netmiko_conn = device_interface.NetmikoConn()
-        netmiko_conn.set_up_conn(dut)
-        login_ptr["ssh_conn"] = netmiko_conn
+    return logins
 
-        pyeapi_conn = device_interface.PyeapiConn()
-        pyeapi_conn.set_up_conn(dut)
-        login_ptr["eapi_conn"] = pyeapi_conn
 
-        if eos_conn == "eapi":
-            login_ptr["connection"] = pyeapi_conn
-        elif eos_conn == "ssh":
-            login_ptr["connection"] = netmiko_conn
-        else:
-            raise ValueError(f"Invalid EOS conn type {eos_conn} specified")
+def login_dut(dut, test_parameters, eos_conn, network_configs):
+    """Connect to an Arista switch over ssh and eapi
 
-        login_ptr["name"] = name
-        login_ptr["mgmt_ip"] = dut["mgmt_ip"]
-        login_ptr["username"] = dut["username"]
-        login_ptr["password"] = dut["password"]
-        login_ptr["role"] = dut["role"]
-        login_ptr["neighbors"] = dut["neighbors"]
-        login_ptr["transport"] = dut["transport"]
-        login_ptr["results_dir"] = test_parameters["parameters"]["results_dir"]
-        login_ptr["report_dir"] = test_parameters["parameters"]["report_dir"]
+    Args:
+      dut (dict): dut parameters from the duts file
+      test_parameters (dict): Abstraction of testing parameters
+      eos_conn (str): connection type used for testing: either eapi or ssh
+      network_configs (dict): network configs keyed by dut name
 
-        if name in network_configs:
-            login_ptr["network_configs"] = network_configs[name]
+    Returns:
+      login (dict): connections and details of the dut
+    """
+    name = dut["name"]
+    login = {}
 
-    logging.debug(f"Returning duts logins: {logins}")
+    logging.debug("Connecting to switch: %s using parameters: %s", name, dut)
 
-    return logins
+    netmiko_conn = device_interface.NetmikoConn()
+    netmiko_conn.set_up_conn(dut)
+    login["ssh_conn"] = netmiko_conn
+
+    pyeapi_conn = device_interface.PyeapiConn()
+    pyeapi_conn.set_up_conn(dut)
+    login["eapi_conn"] = pyeapi_conn
+
+    if eos_conn == "eapi":
+        login["connection"] = pyeapi_conn
+    else:
+        login["connection"] = netmiko_conn
+
+    login["name"] = name
+    login["mgmt_ip"] = dut["mgmt_ip"]
+    login["username"] = dut["username"]
+    login["password"] = dut["password"]
+    login["role"] = dut["role"]
+    login["neighbors"] = dut["neighbors"]
+    login["transport"] = dut["transport"]
+    login["results_dir"] = test_parameters["parameters"]["results_dir"]
+    login["report_dir"] = test_parameters["parameters"]["report_dir"]
+
+    if name in network_configs:
+        login["network_configs"] = network_configs[name]
+
+    return login
 
 
 def send_cmds(show_cmds, conn, encoding):
-    """Send show commands to duts and recurse on failure
+    """Send show commands to duts, dropping failing commands and retrying
+    with the rest on failure
 
     Args:
         show_cmds (list): List of pre-processed commands
@@ -292,31 +399,63 @@ def send_cmds(show_cmds, conn, encoding):
         show_cmd_list (list): list of show commands
     """
 
-    try:
-        logging.debug(f"List of show commands in show_cmds with encoding {encoding}: {show_cmds}")
+    while show_cmds:
+        try:
+            logging.debug(
+                "List of show commands in show_cmds with encoding %s: %s", encoding, show_cmds
+            )
 
-        if encoding == "json":
-            show_cmd_list = conn.run_commands(show_cmds)
-        elif encoding == "text":
-            show_cmd_list = conn.run_commands(show_cmds, encoding="text")
+            if encoding == "json":
+                show_cmd_list = conn.run_commands(show_cmds)
+            elif encoding == "text":
+                show_cmd_list = conn.run_commands(show_cmds, encoding="text")
 
-        logging.info("Ran all show commands on dut")
-        logging.debug(f"Ran all show cmds with encoding {encoding}: {show_cmds}")
+            logging.info("Ran all show commands on dut")
+            logging.debug("Ran all show cmds with encoding %s: %s", encoding, show_cmds)
+            logging.debug("Return all show cmds: %s", show_cmd_list)
+
+            return show_cmd_list, show_cmds
+
+        # pylint: disable-next=broad-exception-caught
+        except Exception as err:
+            logging.error(f"Error running all cmds: {err}")
+
+            cmds_count = len(show_cmds)
+            show_cmds = remove_cmd(err, show_cmds)
+
+            logging.debug("New show_cmds: %s", show_cmds)
+
+            # the error does not name any of the commands, retrying would fail again
+            if len(show_cmds) == cmds_count:
+                logging.error("Unable to run show cmds with encoding %s: %s", encoding, show_cmds)
+                break
+
+    return [], []
 
-    # pylint: disable-next=broad-exception-caught
-    except Exception as err:
-        logging.error(f"Error running all cmds: {err}")
 
-        show_cmds = remove_cmd(err, show_cmds)
+def send_cmd_batches(show_cmds, conn, encoding):
+    """Send show commands to duts in batches of SHOW_CMDS_BATCH_SIZE commands,
+    so a large command list is not sent as a single eAPI request
 
-        logging.debug(f"New show_cmds: {show_cmds}")
+    Args:
+        show_cmds (list): List of pre-processed commands
+        conn (obj): connection
+        encoding (string): encoding type of show commands: either json or text
 
-        show_cmd_list = send_cmds(show_cmds, conn, encoding)
-        show_cmd_list = show_cmd_list[0]
+    Returns:
+        show_cmd_list (list): list of show command outputs
+        sent_cmds (list): list of show commands the outputs belong to
+    """
+    show_cmd_list = []
+    sent_cmds = []
 
-    logging.debug(f"Return all show cmds: {show_cmd_list}")
+    for batch_start in range(0, len(show_cmds), SHOW_CMDS_BATCH_SIZE):
+        batch = show_cmds[batch_start : batch_start + SHOW_CMDS_BATCH_SIZE]
+        batch_output, batch_cmds = send_cmds(batch, conn, encoding)
+        show_cmd_list.extend(batch_output)
+        sent_cmds.extend(batch_cmds)
 
-    return show_cmd_list, show_cmds
+    return show_cmd_list, sent_cmds
 
 
 def remove_cmd(err, show_cmds):
@@ -327,26 +466,29 @@ def remove_cmd(err, show_cmds):
         show_cmds (list): List of pre-processed commands
 
     Returns:
-        show_cmds (list): List of post-processed commands
+        show_cmds (list): New list of post-processed commands, the inputted
+        list is left unchanged
     """
-    logging.debug(f"remove_cmd: {err}")
-    logging.debug(f"remove_cmd show_cmds list: {show_cmds}")
+    logging.debug("remove_cmd: %s", err)
+    logging.debug("remove_cmd show_cmds list: %s", show_cmds)
 
     longest_matching_cmd = ""
+    err_msg = str(err)
 
     for show_cmd in show_cmds:
-        if show_cmd in str(err) and longest_matching_cmd in show_cmd:
+        if show_cmd in err_msg and longest_matching_cmd in show_cmd:
             longest_matching_cmd = show_cmd
 
     # longest_matching_cmd is the one in error string, lets bump it out
     if longest_matching_cmd:
-        cmd_index = show_cmds.index(longest_matching_cmd)
-        show_cmds.pop(cmd_index)
+        show_cmds = [show_cmd for show_cmd in show_cmds if show_cmd != longest_matching_cmd]
 
         logging.info(f"Removed {longest_matching_cmd} due to an error")
         logging.debug(f"Removed {longest_matching_cmd} because of {err}")
 
-    return show_cmds
+        return show_cmds
+
+    return list(show_cmds)
 
 
 def dut_worker(dut, show_cmds, test_parameters):
@@ -364,17 +506,18 @@ def dut_worker(dut, show_cmds, test_parameters):
     dut["output"]["interface_list"] = return_interfaces(name, test_parameters)
 
     logging.info(f"Executing show commands on {name}")
-    logging.debug(f"List of show commands {show_cmds}")
+    logging.debug("List of show commands %s", show_cmds)
+
+    show_cmd_json_list, show_cmds_json = send_cmd_batches(show_cmds, conn, "json")
 
-    all_cmds_json = show_cmds.copy()
-    show_cmd_json_list, show_cmds_json = send_cmds(all_cmds_json, conn, "json")
+    logging.debug("Returned from send_cmds_json %s", show_cmds_json)
 
-    logging.debug(f"Returned from send_cmds_json {show_cmds_json}")
+    show_cmd_txt_list, show_cmds_txt = send_cmd_batches(show_cmds, conn, "text")
 
-    all_cmds_txt = show_cmds.copy()
-    show_cmd_txt_list, show_cmds_txt = send_cmds(all_cmds_txt, conn, "text")
+    logging.debug("Returned from send_cmds_txt %s", show_cmds_txt)
 
-    logging.debug(f"Returned from send_cmds_txt {show_cmds_txt}")
+    json_indexes = {show_cmd: cmd_index for cmd_index, show_cmd in enumerate(show_cmds_json)}
+    txt_indexes = {show_cmd: cmd_index for cmd_index, show_cmd in enumerate(show_cmds_txt)}
 
     for show_cmd in show_cmds:
         function_def = f'test_{("_").join(show_cmd.split())}'
@@ -384,10 +527,9 @@ def dut_worker(dut, show_cmds, test_parameters):
 
         dut["output"][show_cmd] = {}
 
-        if show_cmd in show_cmds_json:
-            cmd_index = show_cmds_json.index(show_cmd)
-
-            logging.debug(f"Found cmd: {show_cmd} at index {cmd_index} of {show_cmds_json}")
+        cmd_index = json_indexes.get(show_cmd)
+        if cmd_index is not None:
+            logging.debug("Found cmd: %s at index %s of %s", show_cmd, cmd_index, show_cmds_json)
             logging.debug(
                 f"length of cmds: {len(show_cmds_json)} vs length of "
                 f"output {len(show_cmd_json_list)}"
@@ -396,16 +538,15 @@ def dut_worker(dut, show_cmds, test_parameters):
             show_output = show_cmd_json_list[cmd_index]
             dut["output"][show_cmd]["json"] = show_output
 
-            logging.debug(f"Adding cmd {show_cmd} to dut and data {show_output}")
+            logging.debug("Adding cmd %s to dut and data %s", show_cmd, show_output)
         else:
             dut["output"][show_cmd]["json"] = ""
 
             logging.debug(f"No json output for {show_cmd}")
 
-        if show_cmd in show_cmds_txt:
-            cmd_index = show_cmds_txt.index(show_cmd)
-
-            logging.debug(f"Found cmd: {show_cmd} at index {cmd_index} of {show_cmds_txt}")
+        cmd_index = txt_indexes.get(show_cmd)
+        if cmd_index is not None:
+            logging.debug("Found cmd: %s at index %s of %s", show_cmd, cmd_index, show_cmds_txt)
             logging.debug(
                 f"length of cmds: {len(show_cmds_txt)} vs length of "
                 f"output {len(show_cmd_txt_list)}"
@@ -414,14 +555,14 @@ def dut_worker(dut, show_cmds, test_parameters):
             show_output_txt = show_cmd_txt_list[cmd_index]["output"]
             dut["output"][show_cmd]["text"] = show_output_txt
 
-            logging.debug(f"Adding cmd {show_cmd} to dut and data {show_output_txt}")
+            logging.debug("Adding cmd %s to dut and data %s", show_cmd, show_output_txt)
 
         else:
             dut["output"][show_cmd]["text"] = ""
 
             logging.debug(f"No text output for {show_cmd}")
 
-    logging.info(f"{name} updated with show output {dut}")
+    logging.debug("%s updated with show output %s", name, dut)
 
 
 def return_interfaces(hostname, test_parameters):
@@ -437,33 +578,53 @@ def return_interfaces(hostname, test_parameters):
     """
     logging.info("Parse test_parameters for interface connections and return them to test")
 
-    interface_list = []
-    duts = test_parameters["duts"]
+    interfaces_index = _index_interfaces(test_parameters)
 
-    for dut in duts:
-        dut_name = dut["name"]
+    if hostname in interfaces_index:
+        logging.info(f"Discovering interface parameters for: {hostname}")
 
-        if dut_name == hostname:
-            logging.info(f"Discovering interface parameters for: {hostname}")
+    interface_list = [dict(interface) for interface in interfaces_index.get(hostname, [])]
 
-            neighbors = dut["neighbors"]
+    logging.info("Returning interface list.")
+    logging.debug("Returning interface list: %s", interface_list)
 
-            for neighbor in neighbors:
-                interface = {}
+    return interface_list
 
-                logging.debug(f"Adding interface parameters: {neighbor} neighbor for: {dut_name}")
 
-                interface["hostname"] = dut_name
-                interface["interface_name"] = neighbor["port"]
-                interface["z_hostname"] = neighbor["neighborDevice"]
-                interface["z_interface_name"] = neighbor["neighborPort"]
-                interface["media_type"] = ""
-                interface_list.append(interface)
+def _index_interfaces(test_parameters):
+    """Return the interface connections of every dut indexed by hostname, the
+    index is built once per test_parameters object
 
-    logging.info("Returning interface list.")
-    logging.debug(f"Returning interface list: {interface_list}")
+    Args:
+        test_parameters (dict): Abstraction of testing parameters
 
-    return interface_list
+    Returns:
+        dict: dut hostname mapped to its list of interface connections
+    """
+    cached = INTERFACES_INDEX_CACHE.get(id(test_parameters))
+
+    if cached and cached[0] is test_parameters:
+        return cached[1]
+
+    interfaces_index = {}
+    for dut in test_parameters["duts"]:
+        dut_name = dut["name"]
+        interface_list = interfaces_index.setdefault(dut_name, [])
+
+        for neighbor in dut["neighbors"]:
+            interface_list.append(
+                {
+                    "hostname": dut_name,
+                    "interface_name": neighbor["port"],
+                    "z_hostname": neighbor["neighborDevice"],
+                    "z_interface_name": neighbor["neighborPort"],
+                    "media_type": "",
+                }
+            )
+
+    INTERFACES_INDEX_CACHE[id(test_parameters)] = (test_parameters, interfaces_index)
+
+    return interfaces_index
 
 
 def get_parameters(tests_parameters, test_suite, test_case=""):
@@ -477,7 +638,8 @@ def get_parameters(tests_parameters, test_suite, test_case=""):
         case_parameters: test parameters for a test case
     """
     if not test_case:
-        test_case = inspect.stack()[1][3]
+        # pylint: disable-next=protected-access
+        test_case = sys._getframe(1).f_code.co_name
 
         logging.info(f"Setting testcase name to {test_case}")
 
@@ -486,24 +648,67 @@ def get_parameters(tests_parameters, test_suite, test_case=""):
     test_suite = test_suite.split("/")[-1]
 
     logging.info(f"Return testcases for Test Suite: {test_suite}")
+    logging.info(f"Return parameters for Test Case: {test_case}")
 
-    suite_parameters = [
-        param for param in tests_parameters["test_suites"] if param["name"] == test_suite
-    ]
+    case_parameters = _find_case_parameters(tests_parameters, test_suite, test_case)
+    case_parameters["test_suite"] = test_suite
 
-    logging.debug(f"Suite_parameters: {suite_parameters}")
+    return case_parameters
 
-    logging.info(f"Return parameters for Test Case: {test_case}")
 
-    case_parameters = [
-        param for param in suite_parameters[0]["testcases"] if param["name"] == test_case
-    ]
+def _find_case_parameters(tests_parameters, test_suite, test_case):
+    """Return the test case entry of a test suite
+
+    Args:
+        tests_parameters (dict): Abstraction of testing parameters
+        test_suite (str): file name of the test suite
+        test_case (str): name of the test case
+
+    Returns:
+        dict: test case entry as stored in tests_parameters
+    """
+    suite_parameters, case_index = _index_tests(tests_parameters)[test_suite]
+
+    logging.debug("Suite_parameters: [%s]", suite_parameters)
+
+    case_parameters = case_index[test_case]
+
+    logging.debug("Case_parameters: %s", case_parameters)
+
+    return case_parameters
+
+
+def _index_tests(tests_parameters):
+    """Return test suites and test cases indexed by name, the index is built
+    once per tests_parameters object
+
+    Args:
+        tests_parameters (dict): Abstraction of testing parameters
+
+    Returns:
+        dict: test suite name mapped to the test suite and its test cases by name
+    """
+    cached = TESTS_INDEX_CACHE.get(id(tests_parameters))
+
+    # keeping a reference to tests_parameters in the cache stops its id from
+    # being recycled, the identity check guards against it anyway
+    if cached and cached[0] is tests_parameters:
+        return cached[1]
+
+    tests_index = {}
+    for suite in tests_parameters["test_suites"]:
+        if suite["name"] in tests_index:
+            continue
+
+        case_index = {}
+        for case in suite["testcases"]:
+            case_index.setdefault(case["name"], case)
 
-    logging.debug(f"Case_parameters: {case_parameters[0]}")
+        tests_index[suite["name"]] = (suite, case_index)
 
-    case_parameters[0]["test_suite"] = test_suite
+    TESTS_INDEX_CACHE[id(tests_parameters)] = (tests_parameters, tests_index)
 
-    return case_parameters[0]
+    return tests_index
 
 
 def verify_show_cmd(show_cmd, dut):
@@ -598,38 +803,44 @@ def return_show_cmds(test_parameters):
     if show_clock_flag:
         show_cmds.append("show clock")
 
-    logging.debug(f"Discover the names of test suites from {test_parameters}")
+    seen_show_cmds = set(show_cmds)
 
-    test_data = test_parameters["test_suites"]
-    test_suites = [param["name"] for param in test_data]
+    logging.debug("Discover the names of test suites from %s", test_parameters)
 
-    for test_suite in test_suites:
-        test_index = test_suites.index(test_suite)
-        test_cases = test_data[test_index]["testcases"]
+    seen_test_suites = set()
+
+    for test_data in test_parameters["test_suites"]:
+        test_suite = test_data["name"]
+
+        # a repeated test suite name resolves to its first definition
+        if test_suite in seen_test_suites:
+            continue
+        seen_test_suites.add(test_suite)
 
         logging.info(f"Finding show commands in test suite: {test_suite}")
 
-        for test_case in test_cases:
+        for test_case in test_data["testcases"]:
             show_cmd = test_case.get("show_cmd", "")
             if show_cmd:
                 logging.debug(f"Found show command {show_cmd}")
 
-                if show_cmd not in show_cmds:
+                if show_cmd not in seen_show_cmds:
                     logging.debug(f"Adding Show command {show_cmd}")
 
+                    seen_show_cmds.add(show_cmd)
                     show_cmds.append(show_cmd)
             else:
                 test_show_cmds = test_case.get("show_cmds", [])
                 logging.debug(f"Found show commands {test_show_cmds}")
 
-                for show_cmd in (
-                    show_cmd for show_cmd in test_show_cmds if show_cmd not in show_cmds
-                ):
-                    logging.debug(f"Adding Show commands {show_cmd}")
+                for show_cmd in test_show_cmds:
+                    if show_cmd not in seen_show_cmds:
+                        logging.debug(f"Adding Show commands {show_cmd}")
 
-                    show_cmds.append(show_cmd)
+                        seen_show_cmds.add(show_cmd)
+                        show_cmds.append(show_cmd)
 
-    logging.info(f"The following show commands are required for test cases: {show_cmds}")
+    logging.info("The following show commands are required for test cases: %s", show_cmds)
 
     return show_cmds
 
@@ -648,27 +859,69 @@ def return_test_defs(test_parameters):
     report_dir = test_parameters["parameters"]["report_dir"]
     test_definitions_file = test_parameters["parameters"]["test_definitions"]
 
+    dir_paths = []
     for test_directory in test_dirs:
-        tests_info = os.walk(test_directory)
-        for dir_path, _, file_names in tests_info:
-            for file_name in file_names:
-                if file_name == test_definitions_file:
-                    file_path = f"{dir_path}/{file_name}"
-                    test_def = import_yaml(file_path)
-                    for test_suite in test_def:
-                        test_suite["dir_path"] = f"{dir_path}"
-                        import_config(dir_path, test_suite)
-                    test_defs["test_suites"] += test_def
+        dir_paths.extend(_walk_test_dirs(test_directory, test_definitions_file))
+
+    # read the definition files concurrently, results are kept in walk order
+    file_paths = [f"{dir_path}/{test_definitions_file}" for dir_path in dir_paths]
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(32, len(file_paths) or 1)
+    ) as executor:
+        test_def_files = list(executor.map(import_yaml, file_paths))
+
+    for dir_path, test_def in zip(dir_paths, test_def_files):
+        for test_suite in test_def:
+            test_suite["dir_path"] = f"{dir_path}"
+            import_config(dir_path, test_suite)
+        test_defs["test_suites"] += test_def
 
     logging.info(f"Creating {report_dir} reports directory")
     os.makedirs(report_dir, exist_ok=True)
     export_yaml(report_dir + "/" + test_definitions_file, test_defs)
 
-    logging.debug(f"Return the following test definitions data structure {test_defs}")
+    logging.debug("Return the following test definitions data structure %s", test_defs)
 
     return test_defs
 
 
+def _walk_test_dirs(test_directory, test_definitions_file):
+    """Yield the directories under test_directory holding a test definitions
+    file, in the same top down order as os.walk
+
+    Args:
+        test_directory (str): Root of the directory tree to search
+        test_definitions_file (str): Name of the test definitions file
+
+    Yields:
+        str: path of a directory containing the test definitions file
+    """
+    dir_stack = [test_directory]
+
+    while dir_stack:
+        dir_path = dir_stack.pop()
+        sub_dirs = []
+        has_test_definitions = False
+
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # like os.walk, symlinked directories are listed but not entered
+                        if not entry.is_symlink():
+                            sub_dirs.append(entry.path)
+                    elif entry.name == test_definitions_file:
+                        has_test_definitions = True
+        except OSError as err:
+            logging.debug("Unable to scan directory %s: %s", dir_path, err)
+            continue
+
+        if has_test_definitions:
+            yield dir_path
+
+        dir_stack.extend(reversed(sub_dirs))
+
+
 def import_config(dir_path, test_suite):
     """Check for setup file.  If setup file exists import configuration for reporting
 
@@ -685,7 +938,7 @@ def import_config(dir_path, test_suite):
             )
 
             setup_config = import_yaml(setup_file)
-            logging.debug(f"Configuration setup is {setup_config}")
+            logging.debug("Configuration setup is %s", setup_config)
 
             dev_ids = setup_config.get("key", "name")
             logging.debug(f"Imported configuration will uses {dev_ids}")
@@ -718,7 +971,7 @@ def import_config_from_name(setup_config, testcase):
             formatted_config = setup_template.render(setup_schema)
             testcase["configuration"] += f"{formatted_config}\n"
 
-        logging.debug(f"Updated test case data structure with setup: {testcase['configuration']}")
+        logging.debug("Updated test case data structure with setup: %s", testcase["configuration"])
 
 
 def import_config_from_role(setup_config, testcase):
@@ -767,7 +1020,7 @@ def return_duts_with_role(role_name):
         if dut_role == role_name:
             dev_names.append(dut["name"])
 
-    logging.debug(f"The following DUTs: {dev_names} have role: {role_name}")
+    logging.debug("The following DUTs: %s have role: %s", dev_names, role_name)
 
     return dev_names
 
@@ -784,9 +1037,9 @@ def export_yaml(yaml_file, yaml_data):
     try:
         with open(yaml_file, "w", encoding="utf-8") as yaml_out:
             try:
-                logging.debug(f"Output the following yaml: {yaml_data}")
+                logging.debug("Output the following yaml: %s", yaml_data)
 
-                yaml.dump(yaml_data, yaml_out, default_flow_style=False)
+                yaml.dump(yaml_data, yaml_out, Dumper=YamlDumper, default_flow_style=False)
             except yaml.YAMLError as err:
                 print(">>> ERROR IN YAML FILE")
                 logging.error(f"ERROR IN YAML FILE: {err}")
@@ -799,6 +1052,60 @@ def export_yaml(yaml_file, yaml_data):
         sys.exit(1)
 
 
+def export_json(json_file, json_data):
+    """Export python data structure as a JSON file
+
+    Values JSON cannot represent natively, such as dates, are written as strings,
+    tuples are written as lists and non-string dict keys, such as interface
+    numbers or tuples, are written as strings, so they read back with those types.
+
+    Args:
+        json_file (str): Name of JSON file
+        json_data (dict): Data to be written to json file
+    """
+    logging.info(f"Opening {json_file} for write")
+
+    try:
+        with open(json_file, "w", encoding="utf-8") as json_out:
+            try:
+                logging.debug("Output the following json: %s", json_data)
+
+                json.dump(_json_keys(json_data), json_out, indent=2, default=str)
+            except (TypeError, ValueError) as err:
+                print(">>> ERROR IN JSON FILE")
+                logging.error(f"ERROR IN JSON FILE: {err}")
+                logging.error("EXITING TEST RUNNER")
+                sys.exit(1)
+    except OSError as err:
+        print(f">>> {json_file} JSON FILE MISSING")
+        logging.error(f"ERROR JSON FILE: {json_file} NOT " + f"FOUND. {err}")
+        logging.error("EXITING TEST RUNNER")
+        sys.exit(1)
+
+
+def _json_keys(json_data):
+    """Return json_data with dict keys JSON cannot encode, such as tuples,
+    converted to strings
+
+    Args:
+        json_data (any): Data to be written to json file
+
+    Returns:
+        any: json_data with only str, int, float, bool or None dict keys
+    """
+    if isinstance(json_data, dict):
+        return {
+            key
+            if key is None or isinstance(key, (str, int, float))
+            else str(key): _json_keys(value)
+            for key, value in json_data.items()
+        }
+    if isinstance(json_data, (list, tuple)):
+        return [_json_keys(value) for value in json_data]
+
+    return json_data
+
+
 def export_text(text_file, text_data, dut_name):
     """Export python data structure as a TEXT file
 
@@ -814,7 +1121,7 @@ def export_text(text_file, text_data, dut_name):
 
     try:
         with open(text_file, "a", encoding="utf-8") as text_out:
-            logging.debug(f"Output the following text file: {text_data}")
+            logging.debug("Output the following text file: %s", text_data)
             divider = "================================================================"
             heading = (
                 f"{divider}\nThese commands were run when PRIMARY DUT was {dut_name}\n{divider}\n\n"
@@ -931,21 +1238,24 @@ def create_duts_file(topology_file, inventory_file):
 class TestOps:
     """Common testcase operations and variables"""
 
-    def __init__(self, tests_definitions, test_suite, dut):
+    def __init__(self, tests_definitions, test_suite, dut, test_case=""):
         """Initializes TestOps Object
 
         Args:
             tests_definition (str): YAML representation of NRFU tests
             test_suite (str): name of test suite
             dut (dict): device under test
+            test_case (str): name of test case, defaults to the name of the
+                calling function
         """
-        test_case = inspect.stack()[1][3]
+        if not test_case:
+            # pylint: disable-next=protected-access
+            test_case = sys._getframe(1).f_code.co_name
         self.test_case = test_case
         self.test_parameters = self._get_parameters(tests_definitions, test_suite, self.test_case)
         self.expected_output = self.test_parameters["expected_output"]
         self.dut = dut
         self.dut_name = self.dut["name"]
-        self.interface_list = self.dut["output"]["interface_list"]
         self.results_dir = self.dut["results_dir"]
         self.report_dir = self.dut["report_dir"]
 
@@ -970,21 +1280,23 @@ class TestOps:
         self.test_steps = []
         try:
             self.show_cmd = self.test_parameters["show_cmd"]
-            if self.show_cmd:
-                self.show_cmds[self.dut_name].append(self.show_cmd)
-                self._show_cmds[self.dut_name].append(self.show_cmd)
+            test_show_cmds = [self.show_cmd] if self.show_cmd else []
         except KeyError:
-            self.show_cmds[self.dut_name].extend(self.test_parameters["show_cmds"])
-            self._show_cmds[self.dut_name].extend(self.test_parameters["show_cmds"])
+            test_show_cmds = self.test_parameters["show_cmds"]
+
+        # 'show clock' and 'show version' may also be the test's own show
+        # commands, only verify and record their output once
+        for show_cmd in test_show_cmds:
+            if show_cmd not in self.show_cmds[self.dut_name]:
+                self.show_cmds[self.dut_name].append(show_cmd)
+            if show_cmd not in self._show_cmds[self.dut_name]:
+                self._show_cmds[self.dut_name].append(show_cmd)
 
         self.show_cmd_txts = {self.dut_name: []}
-        self.show_cmd_txt = ""
         self._show_cmd_txts = {self.dut_name: []}
 
         if len(self._show_cmds[self.dut_name]) > 0 and self.dut:
             self._verify_show_cmd(self._show_cmds[self.dut_name], self.dut)
-            if self.show_cmd:
-                self.show_cmd_txt = self.dut["output"][self.show_cmd]["text"]
             for show_cmd in self.show_cmds[self.dut_name]:
                 self.show_cmd_txts[self.dut_name].append(self.dut["output"][show_cmd]["text"])
             for show_cmd in self._show_cmds[self.dut_name]:
@@ -998,6 +1310,19 @@ class TestOps:
         self.test_result = False
         self.test_id = self.test_parameters.get("test_id", None)
 
+    @functools.cached_property
+    def interface_list(self):
+        """Interface connections of the dut, looked up on first use"""
+        return self.dut["output"]["interface_list"]
+
+    @functools.cached_property
+    def show_cmd_txt(self):
+        """Text output of the test case's show command, looked up on first use"""
+        if not self.show_cmd:
+            return ""
+
+        return self.dut["output"][self.show_cmd]["text"]
+
     def _verify_show_cmd(self, show_cmds, dut):
         """Verify if show command was successfully executed on dut
 
@@ -1020,7 +1345,7 @@ class TestOps:
                 assert False
 
     def _write_results(self):
-        """Write the yaml output to a text file"""
+        """Write the test case results to a json file"""
         logging.info("Preparing to write results")
 
         test_suite = self.test_parameters["test_suite"]
@@ -1028,12 +1353,12 @@ class TestOps:
         dut_name = self.test_parameters["dut"]
         test_case = self.test_parameters["name"]
         results_dir = self.results_dir
-        yaml_file = f"{results_dir}/result-{test_case}-{dut_name}.yml"
+        json_file = f"{results_dir}/result-{test_case}-{dut_name}.json"
 
-        logging.debug(f"Creating results file named {yaml_file}")
+        logging.debug(f"Creating results file named {json_file}")
 
-        yaml_data = self.test_parameters
-        export_yaml(yaml_file, yaml_data)
+        json_data = self.test_parameters
+        export_json(json_file, json_data)
 
     def _write_text_results(self):
         """Write the text output of show command to a text file"""
@@ -1079,7 +1404,8 @@ class TestOps:
             case_parameters: test parameters for a test case
         """
         if not test_case:
-            test_case = inspect.stack()[1][3]
+            # pylint: disable-next=protected-access
+            test_case = sys._getframe(1).f_code.co_name
 
             logging.info(f"Setting testcase name to {test_case}")
 
@@ -1088,28 +1414,14 @@ class TestOps:
         test_suite = test_suite.split("/")[-1]
 
         logging.debug(f"Return testcases for Test Suite: {test_suite}")
-
-        suite_parameters = [
-            copy.deepcopy(param)
-            for param in tests_parameters["test_suites"]
-            if param["name"] == test_suite
-        ]
-
-        logging.debug(f"Suite_parameters: {suite_parameters}")
-
         logging.info(f"Returning parameters for Test Case: {test_case}")
 
-        case_parameters = [
-            copy.deepcopy(param)
-            for param in suite_parameters[0]["testcases"]
-            if param["name"] == test_case
-        ]
-
-        logging.debug(f"Case_parameters: {case_parameters[0]}")
-
-        case_parameters[0]["test_suite"] = test_suite
+        case_parameters = copy.deepcopy(
+            _find_case_parameters(tests_parameters, test_suite, test_case)
+        )
+        case_parameters["test_suite"] = test_suite
 
-        return case_parameters[0]
+        return case_parameters
 
     def generate_report(self, dut_name, output):
         """Utility to generate report
@@ -1117,7 +1429,7 @@ class TestOps:
         Args:
           dut_name: name of the device
         """
-        logging.debug(f"Output on device {dut_name} after SSH connection is: {output}")
+        logging.debug("Output on device %s after SSH connection is: %s", dut_name, output)
 
         self.test_parameters["comment"] = self.comment
         self.test_parameters["test_result"] = self.test_result
@@ -1217,9 +1529,9 @@ class TestOps:
 
         for step in comments:
             # Add Test steps to list to be added to file
-            self.test_steps.append(step.lstrip("TS:"))
+            self.test_steps.append(step.removeprefix("TS:"))
 
-        logging.info(f"These are test steps {self.test_steps}")
+        logging.info("These are test steps %s", self.test_steps)
 
     def set_evidence_default(self, dut_name):
         """For initializing evidence values for neighbor duts since
@@ -1326,6 +1638,44 @@ class TestOps:
             new_conn=new_conn,
         )
 
+    def run_show_cmds_per_cmd_on_error(self, show_cmds, dut=None, encoding="json"):
+        """run_show_cmds_per_cmd_on_error runs the 'show_cmds' as one batch like
+        run_show_cmds. eAPI fails the whole batch when one command fails, so on an
+        EapiError the evidence recorded for the batch is dropped and each command
+        is run on its own, letting every command get its own result.
+
+        Args: show_cmds: list of show commands to be run
+        dut: the device to run the show commands on
+        encoding: json or text, with json being default
+
+        Returns: A list with the response of each command, or the EapiError the
+        command raised when run on its own
+        """
+        dut_name = (dut or self.dut)["name"]
+        self.set_evidence_default(dut_name)
+        recorded = len(self._show_cmds[dut_name])
+
+        try:
+            return self.run_show_cmds(show_cmds, dut=dut, encoding=encoding)
+        except EapiError as exception:
+            logging.info(
+                "Batch of show cmds failed on dut: %s with %s, running each cmd on its own",
+                dut_name,
+                exception,
+            )
+
+        del self._show_cmds[dut_name][recorded:]
+        del self._show_cmd_txts[dut_name][recorded:]
+
+        outputs = []
+        for show_cmd in show_cmds:
+            try:
+                outputs.extend(self.run_show_cmds([show_cmd], dut=dut, encoding=encoding))
+            except EapiError as exception:
+                outputs.append(exception)
+
+        return outputs
+
     def _run_and_record_cmds(
         self, cmds, conn_type, timeout, new_conn, encoding="json", cmd_type="show", dut=None
     ):
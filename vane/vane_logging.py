@@ -1,12 +1,18 @@
 """ Logger functionality for Vane to add logs to vane.log file"""
 
+import os
 import logging
 
 FORMAT = "[%(asctime)s %(filename)s->%(funcName)s():%(lineno)s]%(levelname)s: %(message)s"
 
+# pytest-xdist workers (-n) each log to their own file, otherwise every worker
+# would truncate and interleave writes into the controller's vane.log
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+LOG_FILE = f"vane-{XDIST_WORKER}.log" if XDIST_WORKER else "vane.log"
+
 logging.basicConfig(
     level=logging.INFO,
-    filename="vane.log",
+    filename=LOG_FILE,
     filemode="w",
     format=FORMAT,
 )